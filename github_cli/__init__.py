@@ -0,0 +1,26 @@
+# The library functions are loaded on first use so the command line does not pay for requests at startup.
+_EXPORTS = {
+    "get_user": "github_cli.client",
+    "get_users": "github_cli.client",
+    "iter_events": "github_cli.client",
+    "search_repositories": "github_cli.client",
+    "User": "github_cli.records",
+    "Repo": "github_cli.records",
+    "record_dict": "github_cli.records",
+    "GitHubError": "github_cli.errors",
+    "add_hook": "github_cli.profiling",
+    "remove_hook": "github_cli.profiling",
+    "stage": "github_cli.profiling",
+    "Profiler": "github_cli.profiling"
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'github_cli' has no attribute {name!r}")
+
+    import importlib
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,403 @@
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+import urllib.parse
+
+from github_cli.cache import ResponseCache, default_cache_dir
+from github_cli.errors import GitHubError
+from github_cli.events import EVENT_KEYS
+from github_cli.jsonstream import iter_items, loads, project
+from github_cli.memo import Memo
+from github_cli.profiling import stage
+from github_cli.ratelimit import RateLimiter, is_rate_limited
+from github_cli.records import REPO_KEYS
+
+API_URL = "https://api.github.com"
+
+settings = {
+    "api_url": os.environ.get("GITHUB_API_URL", API_URL).rstrip("/"),
+    "timeout": 10,
+    "retries": 3,
+    "pool_size": 10,
+    "max_rate": 15,
+    "max_wait": 120,
+    "cache": True,
+    "cache_ttl": 60,
+    "cache_size": 50,
+    "memo_size": 256,
+    "stream_json": False
+}
+
+session = None
+session_lock = threading.Lock()
+
+cache = None
+cache_loaded = False
+
+memo = None
+memo_loaded = False
+
+rate_limiters = {}
+
+def configure(**options):
+    unknown = set(options) - set(settings)
+    if unknown:
+        raise TypeError(f"Unknown settings: {', '.join(sorted(unknown))}")
+
+    settings.update(options)
+
+def get_session():
+    # requests is imported on first use, so commands answered by a `serve` daemon never load it.
+    import requests
+    from urllib3.util.retry import Retry
+
+    from github_cli.connections import TimedAdapter
+
+    global session
+
+    with session_lock:
+        if session is None:
+            # One keep-alive pool shared by every fetch, so batch and paginated runs reuse connections.
+            retries = Retry(
+                total=settings['retries'],
+                backoff_factor=0.5,
+                status_forcelist=[500, 502, 503, 504],
+                allowed_methods=["GET"]
+            )
+            adapter = TimedAdapter(pool_connections=1, pool_maxsize=settings['pool_size'], max_retries=retries)
+
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update({
+                "Accept": "application/vnd.github+json",
+                "Accept-Encoding": "gzip, deflate",
+                "User-Agent": "github-info-fetcher"
+            })
+            if os.environ.get("GITHUB_TOKEN"):
+                session.headers["Authorization"] = f"Bearer {os.environ['GITHUB_TOKEN']}"
+
+    return session
+
+def get_cache():
+    global cache, cache_loaded
+
+    with session_lock:
+        if not cache_loaded:
+            cache_loaded = True
+            if settings['cache']:
+                cache_dir = default_cache_dir()
+                try:
+                    os.makedirs(cache_dir, exist_ok=True)
+                    cache = ResponseCache(
+                        os.path.join(cache_dir, "http-cache.sqlite"),
+                        settings['cache_ttl'],
+                        settings['cache_size'] * 1024 * 1024
+                    )
+                except (OSError, sqlite3.Error):
+                    cache = None
+
+    return cache
+
+def get_memo():
+    global memo, memo_loaded
+
+    with session_lock:
+        if not memo_loaded:
+            memo_loaded = True
+            if settings['memo_size'] > 0:
+                memo = Memo(settings['memo_size'], settings['cache_ttl'])
+
+    return memo
+
+def memo_stats():
+    memo = get_memo()
+    return memo.stats() if memo is not None else None
+
+def memoized(url, params, function):
+    # Lookups repeated within a run are answered from memory, and concurrent ones share one request.
+    # GitHub treats logins and search terms without regard to case, so the key is lowercased.
+    memo = get_memo()
+    if memo is None:
+        return function()
+
+    key = f"{url}?{urllib.parse.urlencode(sorted(params.items()))}" if params else url
+    return memo.get(key.lower(), function)
+
+def get_rate_limiter(resource):
+    with session_lock:
+        if resource not in rate_limiters:
+            rate_limiters[resource] = RateLimiter(settings['max_rate'], settings['max_wait'])
+        return rate_limiters[resource]
+
+def cached_response(url, entry):
+    import requests
+    from requests.structures import CaseInsensitiveDict
+
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response.headers = CaseInsensitiveDict(entry['headers'])
+    response.encoding = "utf-8"
+    response._content = entry['body']
+    return response
+
+def github_get(url, params=None, passthrough=()):
+    import requests
+
+    cache = get_cache()
+    if cache is None:
+        return send_request(url, params, passthrough=passthrough)
+
+    url = requests.Request("GET", url, params=params).prepare().url
+    with stage("cache", url=url) as info:
+        entry = cache.get(url)
+        info['bytes'] = len(entry['body']) if entry is not None else 0
+    if entry is not None and entry['expires'] > time.time():
+        return cached_response(url, entry)
+
+    headers = {}
+    if entry is not None and entry['etag']:
+        headers["If-None-Match"] = entry['etag']
+    if entry is not None and entry['last_modified']:
+        headers["If-Modified-Since"] = entry['last_modified']
+
+    response = send_request(url, headers=headers, passthrough=passthrough)
+
+    with stage("cache", url=url):
+        if response.status_code == 304 and entry is not None:
+            cache.refresh(url, response)
+            return cached_response(url, entry)
+        if response.status_code == 200:
+            cache.store(url, response)
+
+    return response
+
+def send_request(url, params=None, headers=None, payload=None, passthrough=()):
+    # A payload is sent as the JSON body of a POST, which only GraphQL uses. Error statuses in
+    # passthrough are returned like 404 is, for callers that can do without the answer.
+    import requests
+
+    limiter = get_rate_limiter("graphql" if url == graphql_url() else "search" if "/search/" in url else "core")
+
+    for attempt in range(settings['retries'] + 1):
+        with stage("throttle"):
+            limiter.acquire()
+
+        try:
+            with stage("fetch", url=url) as info:
+                method = "GET" if payload is None else "POST"
+                response = get_session().request(method, url, params=params, headers=headers, json=payload, timeout=settings['timeout'])
+                # elapsed runs until the headers arrive, so it covers GitHub's own time and, when no
+                # pooled connection was free, the connect stage nested in this one.
+                info.update(status=response.status_code, bytes=len(response.content), wait=response.elapsed.total_seconds())
+        except requests.exceptions.Timeout:
+            raise GitHubError("Request timed out. Please try again later.") from None
+        except requests.exceptions.ConnectionError:
+            raise GitHubError("Connection error. Please check your internet connection.") from None
+        except requests.exceptions.RequestException as e:
+            raise GitHubError(f"Unable to fetch data from GitHub API. {e}") from None
+
+        limiter.update(response)
+        if not is_rate_limited(response) or attempt == settings['retries']:
+            break
+
+        delay = limiter.backoff(response, attempt)
+        if delay <= limiter.max_wait:
+            print(f"Rate limited by GitHub, retrying in {delay:.0f}s.", file=sys.stderr)
+        with stage("throttle"):
+            limiter.wait(delay)
+
+    if is_rate_limited(response):
+        raise GitHubError("GitHub API rate limit exceeded. Please try again later.", response.status_code)
+
+    # Not Found is left to the callers, which know what was being looked up.
+    if response.status_code >= 400 and response.status_code != 404 and response.status_code not in passthrough:
+        try:
+            message = response.json().get('message')
+        except ValueError:
+            message = None
+        raise GitHubError(message or f"GitHub API returned status {response.status_code}.", response.status_code)
+
+    return response
+
+def fetch_github_user(username):
+    url = f"{settings['api_url']}/users/{username}"
+
+    def fetch():
+        response = github_get(url)
+        with stage("decode", bytes=len(response.content)):
+            return loads(response.content)
+
+    return memoized(url, None, fetch)
+
+def graphql_url():
+    # GitHub Enterprise serves REST under /api/v3 and GraphQL at /api/graphql.
+    if settings['api_url'].endswith("/v3"):
+        return f"{settings['api_url'][:-3]}/graphql"
+    return f"{settings['api_url']}/graphql"
+
+def fetch_github_users(usernames):
+    # Every user is an aliased user(login:) lookup in one query, so a whole batch costs a single request.
+    fields = "login name url bio location email twitterUsername followers { totalCount } following { totalCount } createdAt updatedAt"
+    variables = {f"login{index}": username for index, username in enumerate(usernames)}
+    query = "query({}) {{ {} }}".format(
+        ", ".join(f"${name}: String!" for name in variables),
+        " ".join(f"user{index}: user(login: $login{index}) {{ {fields} }}" for index in range(len(usernames)))
+    )
+
+    response = send_request(graphql_url(), payload={"query": query, "variables": variables})
+    with stage("decode", bytes=len(response.content)):
+        body = loads(response.content)
+
+    # Users that do not exist come back as null, each with a NOT_FOUND error beside the data.
+    errors = [error for error in body.get('errors') or [] if error.get('type') != "NOT_FOUND"]
+    if body.get('data') is None or errors:
+        message = (errors or body.get('errors') or [{}])[0].get('message') or body.get('message')
+        raise GitHubError(message or "Unexpected response from the GitHub GraphQL API.", response.status_code)
+
+    return [body['data'].get(f"user{index}") for index in range(len(usernames))]
+
+def fetch_events_page(username, url, params=None):
+    response = github_get(url, params)
+
+    if response.status_code == 404:
+        raise GitHubError(f"User {username} not found.", 404)
+    if not re.match(rb"\s*\[", response.content):
+        raise GitHubError(loads(response.content).get('message', "Unexpected response from GitHub API."), response.status_code)
+
+    # Events are trimmed to EVENT_KEYS, so a kept page never holds the full payloads.
+    with stage("decode", bytes=len(response.content)):
+        page = [project(event, EVENT_KEYS) for event in iter_items(response.content, incremental=settings['stream_json'])]
+
+    return response, page
+
+def fetch_activity_pages(username, max_pages=None):
+    # Always asks GitHub, since follow mode and sync need new pages and their headers.
+    url = f"{settings['api_url']}/users/{username}/events"
+    params = {"per_page": 100}
+    pages = 0
+
+    while url:
+        response, page = fetch_events_page(username, url, params)
+        yield response, page
+
+        pages += 1
+        if max_pages is not None and pages >= max_pages:
+            return
+
+        # The next link already carries per_page and page.
+        url = response.links.get("next", {}).get("url")
+        params = None
+
+def fetch_org_members(org):
+    # The logins of the organization's members, or None when it does not exist. Without a token
+    # that belongs to a member, GitHub only lists the public members.
+    url = f"{settings['api_url']}/orgs/{org}/members"
+    params = {"per_page": 100}
+    members = []
+
+    while url:
+        response = github_get(url, params)
+        if response.status_code == 404:
+            return None
+
+        with stage("decode", bytes=len(response.content)):
+            members.extend(member['login'] for member in iter_items(response.content, incremental=settings['stream_json']))
+
+        url = response.links.get("next", {}).get("url")
+        params = None
+
+    return members
+
+def fetch_github_activity(username, max_pages=None, max_events=None):
+    # The pages go through the memo, so a user looked up twice in a run is fetched once.
+    url = f"{settings['api_url']}/users/{username}/events"
+    params = {"per_page": 100}
+    pages = count = 0
+
+    while url:
+        def fetch():
+            response, page = fetch_events_page(username, url, params)
+            return response.links.get("next", {}).get("url"), page
+
+        next_url, page = memoized(url, params, fetch)
+
+        for event in page:
+            yield event
+            count += 1
+            if max_events is not None and count >= max_events:
+                return
+
+        pages += 1
+        if max_pages is not None and pages >= max_pages:
+            return
+
+        url = next_url
+        params = None
+
+def fetch_github_repo(query, per_page=100, page=1, sort="stars", order="desc"):
+    url = f"{settings['api_url']}/search/repositories"
+    params = {"q": query, "sort": sort, "order": order, "per_page": per_page, "page": page}
+
+    def fetch():
+        response = github_get(url, params)
+        members = {}
+        with stage("decode", bytes=len(response.content)):
+            repos = [project(repo, REPO_KEYS) for repo in iter_items(response.content, "items", members, settings['stream_json'])]
+        return members.get('total_count', len(repos)), repos
+
+    return memoized(url, params, fetch)
+
+# GitHub refuses some repository details without the repository being at fault: the contributors
+# of very large repositories (403), details of empty ones (409) and blocked repositories (451).
+# The detail fetchers report those as unknown instead of failing the whole run.
+DETAIL_STATUSES = (403, 409, 451)
+
+def fetch_repo_languages(full_name):
+    # Bytes of code per language, largest first.
+    response = github_get(f"{settings['api_url']}/repos/{full_name}/languages", passthrough=DETAIL_STATUSES)
+    if response.status_code != 200:
+        return {}
+    with stage("decode", bytes=len(response.content)):
+        return loads(response.content)
+
+def fetch_latest_release(full_name):
+    response = github_get(f"{settings['api_url']}/repos/{full_name}/releases/latest", passthrough=DETAIL_STATUSES)
+    if response.status_code != 200:
+        return None
+    with stage("decode", bytes=len(response.content)):
+        return project(loads(response.content), {"tag_name": None, "published_at": None})
+
+def fetch_contributor_count(full_name):
+    # With one contributor per page, the page number of the last link is the count. None means
+    # GitHub would not say, and an empty repository answers 204 without a body.
+    response = github_get(f"{settings['api_url']}/repos/{full_name}/contributors", {"per_page": 1}, DETAIL_STATUSES)
+    if response.status_code == 204:
+        return 0
+    if response.status_code != 200:
+        return None
+
+    last = response.links.get("last", {}).get("url")
+    if last is not None:
+        return int(urllib.parse.parse_qs(urllib.parse.urlsplit(last).query)['page'][0])
+    with stage("decode", bytes=len(response.content)):
+        return len(loads(response.content))
+
+def fetch_commit_participation(full_name):
+    # Commits per week for the last 52 weeks, oldest first. GitHub answers 202 while it is still
+    # computing the statistics, and None is returned then.
+    response = github_get(f"{settings['api_url']}/repos/{full_name}/stats/participation", passthrough=DETAIL_STATUSES)
+    if response.status_code != 200:
+        return None
+    with stage("decode", bytes=len(response.content)):
+        return loads(response.content).get('all')
+
+def fetch_rate_limit():
+    # /rate_limit itself does not count against the budget, so it skips the cache.
+    response = send_request(f"{settings['api_url']}/rate_limit")
+    with stage("decode", bytes=len(response.content)):
+        return loads(response.content)
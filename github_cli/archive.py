@@ -0,0 +1,83 @@
+import json
+import os
+import sqlite3
+import threading
+
+class EventArchive:
+    def __init__(self, path):
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS events (
+                id INTEGER PRIMARY KEY,
+                user TEXT NOT NULL,
+                type TEXT NOT NULL,
+                repo TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                event TEXT NOT NULL
+            )
+        """)
+        self.connection.execute("CREATE INDEX IF NOT EXISTS events_by_user ON events (user, created_at)")
+        self.connection.execute("CREATE INDEX IF NOT EXISTS events_by_type ON events (user, type, created_at)")
+        self.connection.execute("CREATE INDEX IF NOT EXISTS events_by_repo ON events (user, repo, created_at)")
+        self.connection.commit()
+
+    def high_water_mark(self, username):
+        with self.lock:
+            return self.connection.execute("SELECT COALESCE(MAX(id), 0) FROM events WHERE user = ?", (username.lower(),)).fetchone()[0]
+
+    def count(self, username):
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM events WHERE user = ?", (username.lower(),)).fetchone()[0]
+
+    def add(self, username, events):
+        # Events are only ever added. One already stored is left as it is.
+        rows = [
+            (int(event['id']), username.lower(), event['type'], event['repo']['name'], event['created_at'], json.dumps(event))
+            for event in events
+        ]
+
+        with self.lock:
+            before = self.connection.total_changes
+            self.connection.executemany("INSERT OR IGNORE INTO events VALUES (?, ?, ?, ?, ?, ?)", rows)
+            self.connection.commit()
+            return self.connection.total_changes - before
+
+    def iter_events(self, username, event_types=None, since=None, until=None, repos=None, limit=None):
+        # Newest first, like the API. since and until are ISO timestamps, until is exclusive.
+        conditions = ["user = ?"]
+        params = [username.lower()]
+
+        if event_types:
+            conditions.append(f"type IN ({', '.join('?' * len(event_types))})")
+            params.extend(event_types)
+        if repos:
+            conditions.append(f"repo IN ({', '.join('?' * len(repos))})")
+            params.extend(repos)
+        if since is not None:
+            conditions.append("created_at >= ?")
+            params.append(since)
+        if until is not None:
+            conditions.append("created_at < ?")
+            params.append(until)
+
+        query = f"SELECT event FROM events WHERE {' AND '.join(conditions)} ORDER BY created_at DESC, id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        with self.lock:
+            cursor = self.connection.execute(query, params)
+
+        while True:
+            with self.lock:
+                rows = cursor.fetchmany(500)
+            if not rows:
+                return
+            for (event,) in rows:
+                yield json.loads(event)
+
+def default_data_dir():
+    data_home = os.environ.get("XDG_DATA_HOME") or os.path.join(os.path.expanduser("~"), ".local", "share")
+    return os.path.join(data_home, "github-info-fetcher")
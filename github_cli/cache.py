@@ -0,0 +1,94 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+CACHED_HEADERS = ["Link", "X-Poll-Interval"]
+
+class ResponseCache:
+    def __init__(self, path, ttl, max_size):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                expires REAL NOT NULL,
+                accessed REAL NOT NULL
+            )
+        """)
+        self.connection.commit()
+
+    def max_age(self, response):
+        # GitHub asks clients not to poll the events endpoint more often than X-Poll-Interval.
+        return max(self.ttl, int(response.headers.get("X-Poll-Interval", 0)))
+
+    def get(self, url):
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT etag, last_modified, headers, body, expires FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            self.connection.execute("UPDATE responses SET accessed = ? WHERE url = ?", (time.time(), url))
+            self.connection.commit()
+
+        etag, last_modified, headers, body, expires = row
+        return {
+            "etag": etag,
+            "last_modified": last_modified,
+            "headers": json.loads(headers),
+            "body": zlib.decompress(body),
+            "expires": expires
+        }
+
+    def store(self, url, response):
+        headers = {name: response.headers[name] for name in CACHED_HEADERS if name in response.headers}
+        body = zlib.compress(response.content)
+        now = time.time()
+
+        with self.lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, response.headers.get("ETag"), response.headers.get("Last-Modified"), json.dumps(headers),
+                 body, len(body), now + self.max_age(response), now)
+            )
+            self.evict()
+            self.connection.commit()
+
+    def refresh(self, url, response):
+        with self.lock:
+            self.connection.execute(
+                "UPDATE responses SET expires = ?, accessed = ? WHERE url = ?",
+                (time.time() + self.max_age(response), time.time(), url)
+            )
+            self.connection.commit()
+
+    def evict(self):
+        total = self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_size:
+            return
+
+        # Drop the least recently used responses until the cache fits again.
+        stale = []
+        for url, size in self.connection.execute("SELECT url, size FROM responses ORDER BY accessed"):
+            if total <= self.max_size:
+                break
+            stale.append((url,))
+            total -= size
+
+        self.connection.executemany("DELETE FROM responses WHERE url = ?", stale)
+
+def default_cache_dir():
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_home, "github-info-fetcher")
@@ -0,0 +1,325 @@
+import argparse
+import sys
+
+HELP_MESSAGE = """
+[bold cyan] GitHub CLI Tool[/bold cyan]
+
+ This program allows you to fetch GitHub user information and activity events directly in your terminal.
+
+[bold green] Usage:[/bold green]
+[bold yellow] python github-cli.py <command>[/bold yellow] or [bold yellow]python -m github_cli <command>[/bold yellow]
+
+[bold green] Available Commands:[/bold green]
+
+[bold magenta] help[/bold magenta]        Display this help message.
+[bold magenta] search[/bold magenta]      Fetch and display GitHub user profile information.
+[bold magenta] events[/bold magenta]      Fetch and display GitHub user activity events.
+[bold magenta] org[/bold magenta]         Fetch and display the merged activity of an organization's members.
+[bold magenta] popular[/bold magenta]     Discover popular repositories using optional filters.
+[bold magenta] sync[/bold magenta]        Save new events of users to the local event archive.
+[bold magenta] stats[/bold magenta]       Summarize the activity of one or more users.
+[bold magenta] ratelimit[/bold magenta]   Show how much of the GitHub API budget is left.
+[bold magenta] serve[/bold magenta]       Keep connections and the cache warm and answer the other commands' lookups.
+
+[bold green] Flags for every command:[/bold green]
+[bold magenta] --format[/bold magenta]           Output format: text (default), json, ndjson or csv.
+[bold magenta] --pager[/bold magenta]            Show text output in a pager.
+[bold magenta] --pool-size[/bold magenta]        Number of kept-alive connections to GitHub (default 10).
+[bold magenta] --timeout[/bold magenta]          Seconds to wait for a response (default 10).
+[bold magenta] --retries[/bold magenta]          Retries for connection errors and 5xx responses (default 3).
+[bold magenta] --max-rate[/bold magenta]         Maximum requests per second sent to GitHub (default 15).
+[bold magenta] --max-wait[/bold magenta]         Longest wait in seconds for the rate limit before giving up (default 120).
+[bold magenta] --no-cache[/bold magenta]         Skip the on-disk response cache.
+[bold magenta] --cache-ttl[/bold magenta]        Seconds a cached response is reused without asking GitHub (default 60).
+[bold magenta] --cache-size[/bold magenta]       Maximum cache size in MB (default 50).
+[bold magenta] --memo-size[/bold magenta]        Decoded responses kept in memory for repeated lookups in one run (default 256, 0 turns it off).
+[bold magenta] --stream-json[/bold magenta]      Decode event pages and search results one item at a time, for less memory at some speed.
+[bold magenta] --api-url[/bold magenta]          Base URL of the GitHub API (default $GITHUB_API_URL or https://api.github.com).
+[bold magenta] --profile[/bold magenta]          Print how long each stage took and every request's timing to stderr.
+[bold magenta] --profile-dump[/bold magenta]     Also write a trace, cProfile stats for a .prof path or a JSON trace otherwise (implies --profile).
+[bold magenta] --no-server[/bold magenta]        Fetch from GitHub directly even when "serve" is running.
+
+[bold green] Flags for "search", "events", "org", "stats" and "popular" commands:[/bold green]
+[bold magenta] --save[/bold magenta]             Also write every user, event and search result fetched to a snapshot file.
+[bold magenta] --load[/bold magenta]             Answer from a snapshot file written with --save instead of GitHub.
+
+[bold green] Flags for "search", "events", "sync" and "stats" commands:[/bold green]
+[bold magenta] --file[/bold magenta]             Read more usernames from a file, one per line ("-" reads stdin).
+[bold magenta] --concurrency[/bold magenta]      Number of users fetched at the same time (default 8).
+
+[bold green] Flags for "search" command:[/bold green]
+[bold magenta] --backend[/bold magenta]          rest (default, one request per user) or graphql (50 users per request, needs GITHUB_TOKEN).
+
+[bold green] Flags for "events" command:[/bold green]
+[bold magenta] --default-events[/bold magenta]   Fetch only the main events (Push, PullRequest, Issues, Fork, Watch).
+[bold magenta] --all-events[/bold magenta]       Fetch every type of event.
+[bold magenta] --push[/bold magenta]             Fetch Push events.
+[bold magenta] --pullrequest[/bold magenta]      Fetch Pull Request events.
+[bold magenta] --issues[/bold magenta]           Fetch Issues events.
+[bold magenta] --fork[/bold magenta]             Fetch Fork events.
+[bold magenta] --watch[/bold magenta]            Fetch Watch events.
+[bold magenta] --create[/bold magenta]           Fetch Create events.
+[bold magenta] --release[/bold magenta]          Fetch Release events.
+[bold magenta] --delete[/bold magenta]           Fetch Delete events.
+[bold magenta] --gollum[/bold magenta]           Fetch Gollum (wiki) events.
+[bold magenta] --issuecomment[/bold magenta]     Fetch Issue Comment events.
+[bold magenta] --prreview[/bold magenta]         Fetch Pull Request Review events.
+[bold magenta] --member[/bold magenta]           Fetch Member events.
+[bold magenta] --public[/bold magenta]           Fetch Public events.
+[bold magenta] --max-pages[/bold magenta]        Stop after this many pages of events (100 events per page).
+[bold magenta] --max-events[/bold magenta]       Stop after this many events.
+[bold magenta] --follow[/bold magenta]           Keep polling and print only new events as they appear.
+[bold magenta] --interval[/bold magenta]         Seconds between polls in follow mode (default 60, or GitHub's poll interval if longer).
+[bold magenta] --archive[/bold magenta]          Read events from the local archive filled by "sync" instead of GitHub.
+[bold magenta] --since[/bold magenta]            Only show events from this date on (YYYY-MM-DD).
+[bold magenta] --until[/bold magenta]            Only show events up to and including this date (YYYY-MM-DD).
+[bold magenta] --repo[/bold magenta]             Only show events in this repository, as owner/name (repeat for several).
+
+[bold green] Flags for "org" command:[/bold green]
+[bold magenta] --concurrency[/bold magenta]      Number of members fetched at the same time (default 8).
+ The event type flags and [bold magenta]--max-pages[/bold magenta], [bold magenta]--max-events[/bold magenta] (per member), [bold magenta]--archive[/bold magenta], [bold magenta]--since[/bold magenta], [bold magenta]--until[/bold magenta] and [bold magenta]--repo[/bold magenta] work as for "events".
+
+[bold green] Flags for "sync" command:[/bold green]
+[bold magenta] --max-pages[/bold magenta]        Stop after this many pages of events (100 events per page).
+
+[bold green] Flags for "stats" command:[/bold green]
+[bold magenta] --archive[/bold magenta], [bold magenta]--since[/bold magenta], [bold magenta]--until[/bold magenta], [bold magenta]--repo[/bold magenta], [bold magenta]--max-pages[/bold magenta], [bold magenta]--max-events[/bold magenta]   Select events as for "events".
+[bold magenta] --top[/bold magenta]              Number of repositories listed per ranking (default 10).
+
+[bold green] Flags for "popular" command:[/bold green]
+[bold magenta] --language[/bold magenta]         Filter by programming language (repeat or separate with commas for several).
+[bold magenta] --topic[/bold magenta]            Filter by repository topic (repeat or separate with commas for several).
+[bold magenta] --after[/bold magenta]            Filter repositories created after this date (YYYY-MM-DD).
+[bold magenta] --min_stars[/bold magenta]        Filter repositories with at least this many stars.
+[bold magenta] --stars[/bold magenta]            Filter by a star range, such as 100..500, >=100 or <50.
+[bold magenta] --created[/bold magenta]          Filter by a creation date range, such as 2023-01-01..2023-12-31.
+[bold magenta] --pushed[/bold magenta]           Filter by a last push date range, such as >=2025-01-01.
+[bold magenta] --sort[/bold magenta]             Sort by stars (default), forks, help-wanted-issues or updated.
+[bold magenta] --order[/bold magenta]            Sort order, desc (default) or asc.
+[bold magenta] --limit[/bold magenta]            Limit the number of results shown (default 30, above 1000 the search is split by stars).
+[bold magenta] --concurrency[/bold magenta]      Number of result pages, or detail requests with --enrich, fetched at the same time (default 8).
+[bold magenta] --enrich[/bold magenta]           Also fetch each repository's languages, latest release, contributor count and commit activity.
+
+[bold green] Flags for "serve" command:[/bold green]
+[bold magenta] --host[/bold magenta]             Address to listen on (default 127.0.0.1).
+[bold magenta] --port[/bold magenta]             Port to listen on (default 8787).
+[bold magenta] --verbose[/bold magenta]          Log every request.
+
+[bold green] Examples:[/bold green]
+
+ 1. To fetch GitHub user profile information:
+    [bold yellow] python github-cli.py search Lethios[/bold yellow]
+
+ 2. To fetch the standard events:
+    [bold yellow] python github-cli.py events Lethios[/bold yellow] or
+    [bold yellow] python github-cli.py events Lethios --default-events[/bold yellow]
+
+ 3. To fetch pull request and issues events:
+    [bold yellow] python github-cli.py events Lethios --pullrequest --issues[/bold yellow]
+
+ 4. To fetch several profiles at once:
+    [bold yellow] python github-cli.py search Lethios torvalds --file more-users.txt[/bold yellow]
+
+ 5. To fetch the pushes of everyone in an organization, newest first:
+    [bold yellow] python github-cli.py org github --push[/bold yellow]
+
+ 6. To discover popular Python CLI repos with 200+ stars since 2023:
+    [bold yellow] python github-cli.py popular --language python --topic cli --min-stars 200 --since 2023-01-01[/bold yellow]
+
+ 7. To save an organization's activity once and summarize it again offline:
+    [bold yellow] python github-cli.py org github --save github.snap[/bold yellow]
+    [bold yellow] python github-cli.py org github --load github.snap --since 2025-01-01[/bold yellow]
+
+[bold red] Note:[/bold red] This program fetches data from GitHub, so a valid internet connection is required.
+ Set the [bold yellow]GITHUB_TOKEN[/bold yellow] environment variable to raise the rate limit from 60 to 5000 requests per hour.
+"""
+
+# Commands whose lookups a running `serve` daemon can answer.
+SERVED_COMMANDS = ["search", "events", "org", "stats", "popular"]
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Github Activity Tracker")
+    subparser = parser.add_subparsers(dest="command", required=True)
+
+    common_parser = argparse.ArgumentParser(add_help=False)
+    common_parser.add_argument("--format", action="store", choices=["text", "json", "ndjson", "csv"], default="text")
+    common_parser.add_argument("--pager", action="store_true")
+    common_parser.add_argument("--pool-size", action="store", type=int, default=10)
+    common_parser.add_argument("--timeout", action="store", type=float, default=10)
+    common_parser.add_argument("--retries", action="store", type=int, default=3)
+    common_parser.add_argument("--max-rate", action="store", type=float, default=15)
+    common_parser.add_argument("--max-wait", action="store", type=float, default=120)
+    common_parser.add_argument("--no-cache", action="store_true")
+    common_parser.add_argument("--cache-ttl", action="store", type=int, default=60)
+    common_parser.add_argument("--cache-size", action="store", type=int, default=50)
+    common_parser.add_argument("--memo-size", action="store", type=int, default=256)
+    common_parser.add_argument("--stream-json", action="store_true")
+    common_parser.add_argument("--api-url", action="store")
+    common_parser.add_argument("--profile", action="store_true")
+    common_parser.add_argument("--profile-dump", action="store")
+    common_parser.add_argument("--no-server", action="store_true")
+
+    # The commands that look up users, events or repositories can save those lookups or replay them.
+    snapshot_parser = argparse.ArgumentParser(add_help=False)
+    snapshot_parser.add_argument("--save", action="store")
+    snapshot_parser.add_argument("--load", action="store")
+
+    event_type_parser = argparse.ArgumentParser(add_help=False)
+    event_type_parser.add_argument("--default-events", action="store_true")
+    event_type_parser.add_argument("--all-events", action="store_true")
+    event_type_parser.add_argument("--push", action="store_true")
+    event_type_parser.add_argument("--pullrequest", action="store_true")
+    event_type_parser.add_argument("--issues", action="store_true")
+    event_type_parser.add_argument("--fork", action="store_true")
+    event_type_parser.add_argument("--watch", action="store_true")
+    event_type_parser.add_argument("--create", action="store_true")
+    event_type_parser.add_argument("--release", action="store_true")
+    event_type_parser.add_argument("--delete", action="store_true")
+    event_type_parser.add_argument("--gollum", action="store_true")
+    event_type_parser.add_argument("--issuecomment", action="store_true")
+    event_type_parser.add_argument("--prreview", action="store_true")
+    event_type_parser.add_argument("--member", action="store_true")
+    event_type_parser.add_argument("--public", action="store_true")
+
+    search_parser = subparser.add_parser("search", parents=[common_parser, snapshot_parser])
+    search_parser.add_argument("search", nargs="*")
+    search_parser.add_argument("--file", action="store")
+    search_parser.add_argument("--concurrency", action="store", type=int, default=8)
+    search_parser.add_argument("--backend", action="store", choices=["rest", "graphql"], default="rest")
+
+    events_parser = subparser.add_parser("events", parents=[common_parser, snapshot_parser, event_type_parser])
+    events_parser.add_argument("events", nargs="*")
+    events_parser.add_argument("--file", action="store")
+    events_parser.add_argument("--concurrency", action="store", type=int, default=8)
+    events_parser.add_argument("--max-pages", action="store", type=int)
+    events_parser.add_argument("--max-events", action="store", type=int)
+    events_parser.add_argument("--follow", action="store_true")
+    events_parser.add_argument("--interval", action="store", type=int, default=60)
+    events_parser.add_argument("--archive", action="store_true")
+    events_parser.add_argument("--since", action="store")
+    events_parser.add_argument("--until", action="store")
+    events_parser.add_argument("--repo", action="append")
+
+    org_parser = subparser.add_parser("org", parents=[common_parser, snapshot_parser, event_type_parser])
+    org_parser.add_argument("org")
+    org_parser.add_argument("--concurrency", action="store", type=int, default=8)
+    org_parser.add_argument("--max-pages", action="store", type=int)
+    org_parser.add_argument("--max-events", action="store", type=int)
+    org_parser.add_argument("--archive", action="store_true")
+    org_parser.add_argument("--since", action="store")
+    org_parser.add_argument("--until", action="store")
+    org_parser.add_argument("--repo", action="append")
+
+    stats_parser = subparser.add_parser("stats", parents=[common_parser, snapshot_parser])
+    stats_parser.add_argument("stats", nargs="*")
+    stats_parser.add_argument("--file", action="store")
+    stats_parser.add_argument("--concurrency", action="store", type=int, default=8)
+    stats_parser.add_argument("--archive", action="store_true")
+    stats_parser.add_argument("--since", action="store")
+    stats_parser.add_argument("--until", action="store")
+    stats_parser.add_argument("--repo", action="append")
+    stats_parser.add_argument("--max-pages", action="store", type=int)
+    stats_parser.add_argument("--max-events", action="store", type=int)
+    stats_parser.add_argument("--top", action="store", type=int, default=10)
+
+    sync_parser = subparser.add_parser("sync", parents=[common_parser])
+    sync_parser.add_argument("sync", nargs="*")
+    sync_parser.add_argument("--file", action="store")
+    sync_parser.add_argument("--concurrency", action="store", type=int, default=8)
+    sync_parser.add_argument("--max-pages", action="store", type=int)
+
+    popular_parser = subparser.add_parser("popular", parents=[common_parser, snapshot_parser])
+    popular_parser.add_argument("--language", action="append")
+    popular_parser.add_argument("--topic", action="append")
+    popular_parser.add_argument("--after", action="store")
+    popular_parser.add_argument("--min-stars", action="store")
+    popular_parser.add_argument("--stars", action="store")
+    popular_parser.add_argument("--created", action="store")
+    popular_parser.add_argument("--pushed", action="store")
+    popular_parser.add_argument("--sort", action="store", choices=["stars", "forks", "help-wanted-issues", "updated"], default="stars")
+    popular_parser.add_argument("--order", action="store", choices=["desc", "asc"], default="desc")
+    popular_parser.add_argument("--limit", action="store", type=int)
+    popular_parser.add_argument("--concurrency", action="store", type=int, default=8)
+    popular_parser.add_argument("--enrich", action="store_true")
+
+    subparser.add_parser("ratelimit", parents=[common_parser])
+
+    serve_parser = subparser.add_parser("serve", parents=[common_parser])
+    serve_parser.add_argument("--host", action="store", default="127.0.0.1")
+    serve_parser.add_argument("--port", action="store", type=int, default=8787)
+    serve_parser.add_argument("--verbose", action="store_true")
+
+    return parser
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Help only needs rich, so answer it before building the parser or importing the HTTP stack.
+    if not argv or argv[0] in ("help", "--help", "-h"):
+        from rich.console import Console
+        Console().print(HELP_MESSAGE)
+        return 0
+
+    args = build_parser().parse_args(argv)
+
+    from github_cli import api
+    api.configure(
+        timeout=args.timeout,
+        retries=args.retries,
+        pool_size=args.pool_size,
+        max_rate=args.max_rate,
+        max_wait=args.max_wait,
+        cache=not args.no_cache,
+        cache_ttl=args.cache_ttl,
+        cache_size=args.cache_size,
+        memo_size=args.memo_size,
+        stream_json=args.stream_json
+    )
+    if args.api_url:
+        api.configure(api_url=args.api_url.rstrip("/"))
+
+    # A running `serve` daemon answers lookups from its warm connections and cache, unless
+    # the run asks for fresh responses or replays a snapshot.
+    args.server = None
+    if args.command in SERVED_COMMANDS and not args.no_server and not args.no_cache and not args.load:
+        from github_cli.remote import find_server
+        args.server = find_server(api.settings['api_url'])
+
+    from github_cli import commands
+    if not args.profile and not args.profile_dump:
+        return commands.run(args)
+
+    return run_profiled(commands.run, args)
+
+def run_profiled(run, args):
+    from github_cli.profiling import Profiler, add_hook, remove_hook
+
+    profiler = Profiler()
+    add_hook(profiler)
+
+    cprofile = None
+    if args.profile_dump and args.profile_dump.endswith(".prof"):
+        import cProfile
+        cprofile = cProfile.Profile()
+        cprofile.enable()
+
+    try:
+        return run(args)
+    finally:
+        remove_hook(profiler)
+        if cprofile is not None:
+            # cProfile only sees the main thread, so concurrent fetches show up as waits.
+            cprofile.disable()
+            cprofile.dump_stats(args.profile_dump)
+        elif args.profile_dump:
+            profiler.dump_trace(args.profile_dump)
+
+        print(file=sys.stderr)
+        for line in profiler.summary():
+            print(line, file=sys.stderr)
+
+        from github_cli.api import memo_stats
+        stats = memo_stats()
+        if stats is not None and stats['hits'] + stats['misses'] + stats['shared']:
+            print(f"\nMemo {stats['hits']} hits, {stats['misses']} misses, {stats['shared']} shared in flight, {stats['entries']} entries", file=sys.stderr)
@@ -0,0 +1,126 @@
+import math
+import sys
+
+from github_cli.api import (
+    fetch_commit_participation, fetch_contributor_count, fetch_github_activity, fetch_github_repo, fetch_github_user,
+    fetch_github_users, fetch_latest_release, fetch_repo_languages
+)
+from github_cli.events import EVENT_PARSERS
+from github_cli.query import canonical_query, with_range
+from github_cli.records import Repo, RepoDetails, User
+
+# The Search API never returns more than this many results for one query.
+SEARCH_RESULT_LIMIT = 1000
+SEARCH_PAGE_SIZE = 100
+
+# The requests behind each part of RepoDetails, in the order RepoDetails.from_json takes them.
+DETAIL_FETCHERS = [fetch_repo_languages, fetch_latest_release, fetch_contributor_count, fetch_commit_participation]
+
+# Users looked up per GraphQL request.
+GRAPHQL_BATCH_SIZE = 50
+
+def get_user(username):
+    data = fetch_github_user(username)
+    if 'login' not in data:
+        return None
+    return User.from_json(data)
+
+def get_users(usernames, backend="rest"):
+    # The users in the order given, with None for accounts that do not exist. The REST backend
+    # needs a request per user, GraphQL a single one, which needs GITHUB_TOKEN to be set.
+    if backend == "graphql":
+        return [None if data is None else User.from_graphql(data) for data in fetch_github_users(usernames)]
+    if backend == "rest":
+        return [get_user(username) for username in usernames]
+    raise ValueError(f"Unknown backend: {backend}")
+
+def iter_events(username, event_types=None, max_pages=None, max_events=None):
+    # Records are yielded as the pages arrive, newest first, without grouping them by repository.
+    parsers = EVENT_PARSERS if event_types is None else {event_type: EVENT_PARSERS[event_type] for event_type in event_types}
+
+    for event in fetch_github_activity(username, max_pages, max_events):
+        parser = parsers.get(event['type'])
+        if parser is not None:
+            yield from parser(event)
+
+def search_window(query, count, concurrency, sort, order):
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    per_page = min(count, SEARCH_PAGE_SIZE)
+    total, first_page = fetch_github_repo(query, per_page, 1, sort, order)
+    pages = {1: first_page}
+
+    # The first page tells us how many results exist, so the remaining pages can be fetched together.
+    page_count = math.ceil(min(total, SEARCH_RESULT_LIMIT, count) / per_page)
+    if page_count > 1:
+        with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as executor:
+            futures = {executor.submit(fetch_github_repo, query, per_page, page, sort, order): page for page in range(2, page_count + 1)}
+            for future in as_completed(futures):
+                pages[futures[future]] = future.result()[1]
+
+    repos = [Repo.from_json(repo) for page in sorted(pages) for repo in pages[page]]
+    return total, repos[:count]
+
+def search_repositories(query, limit=30, concurrency=8, sort="stars", order="desc"):
+    # Past the 1000 result ceiling the query is narrowed to repositories with at most as many stars
+    # as the last one found, and searched again until the limit is met.
+    query = canonical_query(query)
+    by_stars = sort == "stars" and order == "desc"
+    found = {}
+    upper = None
+
+    if limit > SEARCH_RESULT_LIMIT and not by_stars:
+        print(f"Only the first {SEARCH_RESULT_LIMIT} results can be fetched unless sorting by stars, highest first.", file=sys.stderr)
+        limit = SEARCH_RESULT_LIMIT
+
+    while len(found) < limit:
+        window = query if upper is None else with_range(query, "stars", (None, upper))
+        ties = sum(1 for repo in found.values() if repo.stargazers_count == upper)
+        total, repos = search_window(window, min(limit - len(found) + ties, SEARCH_RESULT_LIMIT), concurrency, sort, order)
+
+        before = len(found)
+        for repo in repos:
+            # Results can shift between pages while they are fetched, so the same repository may show up twice.
+            found.setdefault(repo.html_url, repo)
+
+        if total <= len(repos) or not repos or not by_stars:
+            break
+        if len(found) == before:
+            print(f"Stopped at {len(found)} repositories: more than {SEARCH_RESULT_LIMIT} share {upper} stars.", file=sys.stderr)
+            break
+
+        upper = min(repo.stargazers_count for repo in repos)
+
+    if sort != "stars":
+        return list(found.values())[:limit]
+    return sorted(found.values(), key=lambda repo: repo.stargazers_count, reverse=order == "desc")[:limit]
+
+def enrich_repositories(repos, concurrency=8):
+    # Every detail request of every repository shares one pool. A (repo, details) pair is yielded
+    # as soon as that repository's requests are done, so a slow one does not hold back the rest.
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    # The same repository listed twice is only fetched once.
+    unique = {}
+    for repo in repos:
+        unique.setdefault(f"{repo.owner}/{repo.name}", repo)
+
+    results = {full_name: [None] * len(DETAIL_FETCHERS) for full_name in unique}
+    pending = {full_name: len(DETAIL_FETCHERS) for full_name in unique}
+
+    executor = ThreadPoolExecutor(max_workers=max(concurrency, 1))
+    try:
+        futures = {
+            executor.submit(fetch, full_name): (full_name, part)
+            for full_name in unique for part, fetch in enumerate(DETAIL_FETCHERS)
+        }
+
+        for future in as_completed(futures):
+            full_name, part = futures[future]
+            results[full_name][part] = future.result()
+            pending[full_name] -= 1
+            if pending[full_name] == 0:
+                yield unique[full_name], RepoDetails.from_json(full_name, *results.pop(full_name))
+    finally:
+        # Stopping early, or a request giving up, drops whatever has not started yet.
+        executor.shutdown(cancel_futures=True)
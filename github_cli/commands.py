@@ -0,0 +1,691 @@
+import datetime
+import heapq
+import itertools
+import os
+import sqlite3
+import sys
+import time
+
+from github_cli.api import fetch_activity_pages, fetch_github_activity, fetch_org_members, fetch_rate_limit, get_rate_limiter
+from github_cli.client import GRAPHQL_BATCH_SIZE, enrich_repositories, get_users, search_repositories
+from github_cli.errors import GitHubError
+from github_cli.events import DEFAULT_EVENTS, EVENT_FLAGS, EVENT_PARSERS, build_repo_event_info, classify_events, event_document, event_rows
+from github_cli.output import (
+    ENRICHED_REPO_FIELDS, EVENT_FIELDS, RATELIMIT_FIELDS, REPO_FIELDS, STATS_FIELDS, SYNC_FIELDS, USER_FIELDS, RecordWriter, diagnostics
+)
+from github_cli.output import settings as output_settings
+from github_cli.profiling import stage
+from github_cli.query import build_query
+from github_cli.records import Repo, RepoDetails, User, record_dict
+
+def read_usernames(usernames, path):
+    usernames = list(usernames)
+
+    if path == "-":
+        usernames.extend(line.strip() for line in sys.stdin)
+    elif path is not None:
+        try:
+            with open(path) as file:
+                usernames.extend(line.strip() for line in file)
+        except OSError as e:
+            print(f"Error: Unable to read usernames from {path}. {e.strerror}", file=diagnostics())
+            sys.exit(1)
+
+    # Drop blanks and repeats while keeping the order the names were given in.
+    usernames = list(dict.fromkeys(username for username in usernames if username))
+    if not usernames:
+        print("Error: No usernames given.", file=diagnostics())
+        sys.exit(1)
+
+    return usernames
+
+def run_concurrently(usernames, fetch, render, concurrency, skip=None):
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    skip = skip or print_skipped
+    failed = False
+
+    with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as executor:
+        futures = {executor.submit(fetch, username): username for username in usernames}
+
+        try:
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except GitHubError as e:
+                    print(f"Error: {e.message}", file=diagnostics())
+                    skip(futures[future])
+                    failed = True
+                    continue
+                except SystemExit:
+                    # The fetcher already printed why it gave up on this user.
+                    skip(futures[future])
+                    failed = True
+                    continue
+
+                if render(futures[future], result) is False:
+                    failed = True
+        except BaseException:
+            # A closed output pipe or an interrupt drops the fetches that have not started yet.
+            executor.shutdown(cancel_futures=True)
+            raise
+
+    if failed:
+        sys.exit(1)
+
+def print_skipped(username):
+    if output_settings['format'] != "text":
+        print(f"Skipped {username}.", file=sys.stderr)
+        return
+
+    from github_cli.render import print_skipped
+    print_skipped(username)
+
+# args.server is the URL of a running `serve` daemon, when cli.main found one, and lookups then go through it.
+# With --load every lookup is answered from a snapshot instead, and with --save each one is also written to one.
+
+def limits_description(max_pages, max_events):
+    limits = [f"{name} {value}" for name, value in [("--max-pages", max_pages), ("--max-events", max_events)] if value is not None]
+    return f" with {" and ".join(limits)}" if limits else " without --max-pages or --max-events"
+
+def snapshot_lookup(args, kind, key, description):
+    if (kind, key) not in args.snapshot:
+        print(f"Error: {description} is not in the snapshot {args.load}.", file=diagnostics())
+        sys.exit(1)
+    try:
+        return args.snapshot.get(kind, key)
+    except ValueError as e:
+        print(f"Error: {e}.", file=diagnostics())
+        sys.exit(1)
+
+def lookup_users(args, usernames):
+    if args.snapshot is not None:
+        users = [snapshot_lookup(args, "user", username.lower(), f"User {username}") for username in usernames]
+        return [None if user is None else User(**user) for user in users]
+
+    if args.server:
+        from github_cli import remote
+        users = remote.get_users(args.server, usernames, args.backend)
+    else:
+        users = get_users(usernames, args.backend)
+
+    if args.recorder is not None:
+        for username, user in zip(usernames, users):
+            args.recorder.add("user", username.lower(), None if user is None else record_dict(user))
+    return users
+
+def lookup_activity(args, username):
+    # A history cut short by --max-pages or --max-events is only replayed with the same limits.
+    key = (username.lower(), args.max_pages, args.max_events)
+    if args.snapshot is not None:
+        return iter(snapshot_lookup(args, "events", key, f"The activity of {username}{limits_description(args.max_pages, args.max_events)}"))
+
+    if args.server:
+        from github_cli import remote
+        events = remote.fetch_github_activity(args.server, username, args.max_pages, args.max_events)
+    else:
+        events = fetch_github_activity(username, args.max_pages, args.max_events)
+
+    if args.recorder is not None:
+        # Every page is read before filtering, so the snapshot can be replayed with other --since,
+        # --until and --repo values.
+        events = list(events)
+        args.recorder.add("events", key, events)
+        return iter(events)
+    return events
+
+def lookup_repositories(args, query, limit):
+    key = (query, args.sort, args.order, limit)
+    if args.snapshot is not None:
+        repos = snapshot_lookup(args, "search", key, f"The search {query} with a limit of {limit}")
+        return [Repo(**repo) for repo in repos]
+
+    if args.server:
+        from github_cli import remote
+        repos = remote.search_repositories(args.server, query, limit, args.concurrency, args.sort, args.order)
+    else:
+        repos = search_repositories(query, limit, args.concurrency, args.sort, args.order)
+
+    if args.recorder is not None:
+        args.recorder.add("search", key, [record_dict(repo) for repo in repos])
+    return repos
+
+def lookup_members(args, org):
+    if args.snapshot is not None:
+        return snapshot_lookup(args, "members", org.lower(), f"Organization {org}")
+
+    if args.server:
+        from github_cli import remote
+        members = remote.fetch_org_members(args.server, org)
+    else:
+        members = fetch_org_members(org)
+    if args.recorder is not None:
+        args.recorder.add("members", org.lower(), members)
+    return members
+
+def lookup_details(args, repos):
+    if args.snapshot is not None:
+        unique = {}
+        for repo in repos:
+            unique.setdefault(f"{repo.owner}/{repo.name}", repo)
+        for full_name, repo in unique.items():
+            yield repo, RepoDetails(**snapshot_lookup(args, "details", full_name.lower(), f"The details of {full_name}"))
+        return
+
+    for repo, details in enrich_repositories(repos, args.concurrency):
+        if args.recorder is not None:
+            args.recorder.add("details", details.full_name.lower(), record_dict(details))
+        yield repo, details
+
+def open_snapshots(args):
+    from github_cli.snapshot import Snapshot, SnapshotWriter
+
+    args.snapshot = args.recorder = None
+    # A run answered from a snapshot fetches nothing that could be saved, and with the same path
+    # the writer would truncate the file while it is mapped.
+    if getattr(args, "load", None) and getattr(args, "save", None):
+        print("Error: The --save and --load flags cannot be used together.", file=diagnostics())
+        sys.exit(1)
+
+    if getattr(args, "load", None):
+        try:
+            args.snapshot = Snapshot(args.load)
+        except OSError as e:
+            print(f"Error: Unable to read the snapshot {args.load}. {e.strerror}", file=diagnostics())
+            sys.exit(1)
+        except ValueError as e:
+            print(f"Error: {e}.", file=diagnostics())
+            sys.exit(1)
+
+    if getattr(args, "save", None):
+        try:
+            args.recorder = SnapshotWriter(args.save)
+        except OSError as e:
+            print(f"Error: Unable to write the snapshot {args.save}. {e.strerror}", file=diagnostics())
+            sys.exit(1)
+
+def handle_search_command(args):
+    usernames = read_usernames(args.search, args.file)
+    writer = None
+
+    if args.backend == "graphql" and args.snapshot is None and not os.environ.get("GITHUB_TOKEN"):
+        print("Error: The GraphQL backend needs a token. Set GITHUB_TOKEN and try again.", file=diagnostics())
+        sys.exit(1)
+
+    if args.format == "text":
+        from github_cli.render import render_user as render
+    else:
+        writer = RecordWriter(args.format, USER_FIELDS)
+
+        def render(username, user):
+            if user is None:
+                print(f"Error: User {username} not found.", file=diagnostics())
+                return False
+            writer.write(record_dict(user))
+
+    # A GraphQL request looks up a whole batch of users, a REST request just one.
+    batch_size = GRAPHQL_BATCH_SIZE if args.backend == "graphql" else 1
+    batches = [tuple(usernames[start:start + batch_size]) for start in range(0, len(usernames), batch_size)]
+
+    def fetch(batch):
+        return lookup_users(args, batch)
+
+    def render_batch(batch, users):
+        results = [render(username, user) for username, user in zip(batch, users)]
+        if False in results:
+            return False
+
+    def skip(batch):
+        for username in batch:
+            print_skipped(username)
+
+    try:
+        if len(batches) == 1:
+            if render_batch(batches[0], fetch(batches[0])) is False:
+                sys.exit(1)
+        else:
+            run_concurrently(batches, fetch, render_batch, args.concurrency, skip)
+    finally:
+        if writer is not None:
+            writer.close()
+
+def open_archive():
+    from github_cli.archive import EventArchive, default_data_dir
+
+    data_dir = default_data_dir()
+    try:
+        os.makedirs(data_dir, exist_ok=True)
+        return EventArchive(os.path.join(data_dir, "events.sqlite"))
+    except (OSError, sqlite3.Error) as e:
+        print(f"Error: Unable to open the event archive in {data_dir}. {e}", file=diagnostics())
+        sys.exit(1)
+
+def filter_events(data, since=None, until=None, repos=None):
+    for event in data:
+        if until is not None and event['created_at'] >= until:
+            continue
+        # Events come newest first, so nothing after an event older than since can match.
+        if since is not None and event['created_at'] < since:
+            return
+        if repos and event['repo']['name'] not in repos:
+            continue
+        yield event
+
+def fetch_new_events(username, last_seen, max_pages=None):
+    # gap is True when every page GitHub keeps was read without reaching last_seen, so events
+    # between the two may be lost. Stopping at max_pages first is a choice, not a gap.
+    new_events = []
+    poll_interval = 0
+
+    for response, page in fetch_activity_pages(username, max_pages):
+        poll_interval = max(poll_interval, int(response.headers.get("X-Poll-Interval", 0)))
+        fresh = [event for event in page if int(event['id']) > last_seen]
+        new_events.extend(fresh)
+
+        # Events come newest first, so once a page reaches an event we have seen, the rest are old.
+        if len(fresh) < len(page):
+            return new_events, poll_interval, False
+
+    return new_events, poll_interval, "next" not in response.links
+
+def event_loader(args, event_types=None):
+    since = until = None
+    try:
+        if args.since is not None:
+            since = datetime.date.fromisoformat(args.since).isoformat()
+        if args.until is not None:
+            until = (datetime.date.fromisoformat(args.until) + datetime.timedelta(days=1)).isoformat()
+    except ValueError:
+        print("Error: The --since and --until flags take dates as YYYY-MM-DD.", file=diagnostics())
+        sys.exit(1)
+
+    if args.archive and (args.load or args.save):
+        print("Error: The --archive flag cannot be used with --save or --load.", file=diagnostics())
+        sys.exit(1)
+    if args.archive:
+        # The archive answers with indexed lookups, so the filters never touch the network.
+        archive = open_archive()
+        return lambda username: archive.iter_events(username, event_types, since, until, args.repo, args.max_events)
+
+    return lambda username: filter_events(lookup_activity(args, username), since, until, args.repo)
+
+def collect_user_events(username, data, event_types, on_first_event=None):
+    first_event = next(data, None)
+
+    login = first_event['actor']['login'] if first_event else username
+    if on_first_event is not None:
+        on_first_event(login)
+
+    if first_event is not None:
+        data = itertools.chain([first_event], data)
+
+    collected = classify_events(data, event_types)
+
+    return login, build_repo_event_info(collected)
+
+def stream_user_events(data, event_types, writer):
+    # Each event is written as soon as it is read, without grouping, so memory stays flat.
+    for event in data:
+        if event['type'] in event_types:
+            with stage("aggregate"):
+                records = EVENT_PARSERS[event['type']](event)
+            for record in records:
+                writer.write({"user": event['actor']['login'], "type": event['type'], **record_dict(record)})
+
+def follow_events(username, event_types, interval, max_pages=None, writer=None):
+    if writer is None:
+        from github_cli.render import print_event_header, print_new_activity_header, render_events
+
+    last_seen = 0
+    first_poll = True
+
+    while True:
+        new_events, poll_interval, _ = fetch_new_events(username, last_seen, max_pages)
+        poll_interval = max(poll_interval, interval)
+
+        if new_events:
+            last_seen = max(int(event['id']) for event in new_events)
+
+        collected = classify_events(new_events, event_types)
+
+        if writer is not None:
+            for row in event_rows(new_events[0]['actor']['login'] if new_events else username, collected):
+                writer.write(row)
+        elif first_poll:
+            print_event_header(new_events[0]['actor']['login'] if new_events else username)
+            render_events(build_repo_event_info(collected))
+        elif any(collected.values()):
+            print_new_activity_header()
+            render_events(build_repo_event_info(collected, missing=None))
+        first_poll = False
+
+        time.sleep(poll_interval)
+
+def select_event_types(args):
+    def check_conflicts(parsed_args):
+        arg_list = [getattr(parsed_args, flag) for flag in EVENT_FLAGS.values()]
+
+        if parsed_args.default_events and parsed_args.all_events:
+            print("Error: The --default-events and --all-events flags cannot be used together.", file=diagnostics())
+            sys.exit(1)
+
+        if parsed_args.default_events and any(arg_list):
+            print("The --default-events flag can only be used on its own.", file=diagnostics())
+            sys.exit(1)
+
+        elif parsed_args.all_events and any(arg_list):
+            print("The --all-events flag can only be used on its own.", file=diagnostics())
+            sys.exit(1)
+    
+    check_conflicts(args)
+
+    if args.all_events:
+        return list(EVENT_PARSERS)
+    if args.default_events:
+        return DEFAULT_EVENTS
+    return [event_type for event_type, flag in EVENT_FLAGS.items() if getattr(args, flag)] or DEFAULT_EVENTS
+
+def handle_event_command(args):
+    event_types = select_event_types(args)
+    usernames = read_usernames(args.events, args.file)
+
+    load = event_loader(args, event_types)
+
+    if args.follow:
+        if args.archive:
+            print("Error: The --follow and --archive flags cannot be used together.", file=diagnostics())
+            sys.exit(1)
+        if args.load or args.save:
+            print("Error: The --follow flag cannot be used with --save or --load.", file=diagnostics())
+            sys.exit(1)
+        if len(usernames) > 1:
+            print("Error: The --follow flag works with a single user.", file=diagnostics())
+            sys.exit(1)
+        if args.format == "json":
+            print("Error: The --follow flag streams events, use --format ndjson or csv instead of json.", file=diagnostics())
+            sys.exit(1)
+
+        writer = RecordWriter(args.format, EVENT_FIELDS) if args.format != "text" else None
+        try:
+            follow_events(usernames[0], event_types, args.interval, args.max_pages, writer)
+        except KeyboardInterrupt:
+            if writer is None:
+                print()
+        return
+
+    if args.format != "text":
+        writer = RecordWriter(args.format, EVENT_FIELDS)
+
+        if args.format == "json":
+            fetch = lambda username: collect_user_events(username, load(username), event_types)
+            render = lambda username, result: writer.write(event_document(*result))
+        else:
+            fetch = lambda username: stream_user_events(load(username), event_types, writer)
+            render = lambda username, result: None
+
+        try:
+            if len(usernames) == 1:
+                render(usernames[0], fetch(usernames[0]))
+            else:
+                run_concurrently(usernames, fetch, render, args.concurrency)
+        finally:
+            writer.close()
+        return
+
+    from github_cli.render import print_event_header, render_events
+
+    if len(usernames) == 1:
+        _, repo_event_info = collect_user_events(usernames[0], load(usernames[0]), event_types, print_event_header)
+        render_events(repo_event_info)
+        return
+
+    def render(username, result):
+        login, repo_event_info = result
+        print_event_header(login)
+        render_events(repo_event_info)
+
+    fetch = lambda username: collect_user_events(username, load(username), event_types)
+    run_concurrently(usernames, fetch, render, args.concurrency)
+
+def merge_member_events(streams):
+    # Every member's events are already newest first, so a k-way heap merge puts the whole
+    # organization in time order without sorting it all again.
+    return heapq.merge(*streams, key=lambda event: (event['created_at'], int(event['id'])), reverse=True)
+
+def handle_org_command(args):
+    event_types = select_event_types(args)
+    load = event_loader(args, event_types)
+
+    members = lookup_members(args, args.org)
+    if members is None:
+        print(f"Error: Organization {args.org} not found.", file=diagnostics())
+        sys.exit(1)
+    if not members:
+        print(f"Error: Organization {args.org} has no public members.", file=diagnostics())
+        sys.exit(1)
+
+    streams = {}
+    failed = False
+    try:
+        run_concurrently(members, lambda username: list(load(username)), streams.__setitem__, args.concurrency)
+    except SystemExit:
+        # The members that could not be fetched were reported as skipped, and the rest are still shown.
+        failed = True
+
+    merged = merge_member_events([streams[member] for member in members if member in streams])
+
+    if args.format in ("ndjson", "csv"):
+        writer = RecordWriter(args.format, EVENT_FIELDS)
+        try:
+            stream_user_events(merged, event_types, writer)
+        finally:
+            writer.close()
+    else:
+        repo_event_info = build_repo_event_info(classify_events(merged, event_types))
+        if args.format == "json":
+            writer = RecordWriter(args.format, EVENT_FIELDS)
+            writer.write(event_document(args.org, repo_event_info))
+            writer.close()
+        else:
+            from github_cli.render import print_event_header, render_events
+            print_event_header(f"{args.org} ({len(streams)} members)")
+            render_events(repo_event_info)
+
+    if failed:
+        sys.exit(1)
+
+def sync_user_events(archive, username, max_pages=None):
+    new_events, _, gap = fetch_new_events(username, archive.high_water_mark(username), max_pages)
+
+    if gap and archive.count(username):
+        print(f"Some events for {username} may be missing: more happened since the last sync than GitHub keeps.", file=sys.stderr)
+
+    return archive.add(username, new_events), archive.count(username)
+
+def handle_sync_command(args):
+    usernames = read_usernames(args.sync, args.file)
+    archive = open_archive()
+    writer = None
+
+    if args.format == "text":
+        from github_cli.render import render_sync as render
+    else:
+        writer = RecordWriter(args.format, SYNC_FIELDS)
+        render = lambda username, result: writer.write({"user": username, "new_events": result[0], "stored_events": result[1]})
+
+    fetch = lambda username: sync_user_events(archive, username, args.max_pages)
+    try:
+        if len(usernames) == 1:
+            render(usernames[0], fetch(usernames[0]))
+        else:
+            run_concurrently(usernames, fetch, render, args.concurrency)
+    finally:
+        if writer is not None:
+            writer.close()
+
+def handle_stats_command(args):
+    from github_cli.stats import compute_stats, stats_rows
+
+    usernames = read_usernames(args.stats, args.file)
+    load = event_loader(args)
+    events = []
+
+    fetch = lambda username: list(load(username))
+    if len(usernames) == 1:
+        events = fetch(usernames[0])
+    else:
+        run_concurrently(usernames, fetch, lambda username, result: events.extend(result), args.concurrency)
+
+    with stage("aggregate"):
+        stats = compute_stats(events, args.top)
+
+    if args.format == "text":
+        from github_cli.render import render_stats
+        render_stats(stats)
+        return
+
+    writer = RecordWriter(args.format, STATS_FIELDS)
+    for row in stats_rows(stats):
+        writer.write(row)
+    writer.close()
+
+def handle_popular_command(args):
+    filters = [args.language, args.topic, args.after, args.min_stars, args.stars, args.created, args.pushed]
+
+    def check_conflicts(parsed_args):
+        if parsed_args.limit is not None and all(flag is None for flag in filters):
+            print("Error: The --limit flag cannot be used as the only flag.", file=diagnostics())
+            sys.exit(1)
+
+    check_conflicts(args)
+
+    if all(flag is None for flag in filters):
+        terms = [("stars", ">1000")]
+        limit = 5
+    else:
+        # --language and --topic can be repeated or take comma separated lists.
+        terms = [("language", value) for values in args.language or [] for value in values.split(",") if value]
+        terms += [("topic", value) for values in args.topic or [] for value in values.split(",") if value]
+        ranges = [("created", f">={args.after}" if args.after else None), ("stars", f">={args.min_stars}" if args.min_stars else None),
+                  ("stars", args.stars), ("created", args.created), ("pushed", args.pushed)]
+        terms += [(qualifier, value) for qualifier, value in ranges if value is not None]
+        limit = args.limit if args.limit is not None else 30
+
+    if limit < 1:
+        print("Error: The --limit flag must be at least 1.", file=diagnostics())
+        sys.exit(1)
+
+    try:
+        query = build_query(terms)
+    except ValueError as e:
+        print(f"Error: {e}.", file=diagnostics())
+        sys.exit(1)
+
+    repos = lookup_repositories(args, query, limit)
+
+    if args.enrich:
+        enrich_popular_repos(repos, args)
+        return
+
+    if args.format != "text":
+        writer = RecordWriter(args.format, REPO_FIELDS)
+        for repo in repos:
+            writer.write(record_dict(repo))
+        writer.close()
+        return
+
+    from github_cli.render import render_repos
+    render_repos(repos)
+
+def enriched_row(repo, details, output_format):
+    row = record_dict(repo) | record_dict(details)
+    del row['full_name']
+    if output_format == "csv":
+        # A CSV cell holds one value, so the languages become "Python:52000 C:3100".
+        row['languages'] = " ".join(f"{language}:{size}" for language, size in details.languages.items())
+    return row
+
+def enrich_popular_repos(repos, args):
+    # Repositories are shown as their details arrive, not in search order.
+    if args.format == "text":
+        from github_cli.render import print_repos_header, render_repo_card
+        print_repos_header()
+        for repo, details in lookup_details(args, repos):
+            render_repo_card(repo, details)
+        return
+
+    writer = RecordWriter(args.format, ENRICHED_REPO_FIELDS)
+    try:
+        for repo, details in lookup_details(args, repos):
+            writer.write(enriched_row(repo, details, args.format))
+    finally:
+        writer.close()
+
+def handle_ratelimit_command(args):
+    data = fetch_rate_limit()
+    budgets = []
+
+    for resource in ["core", "search", "graphql"]:
+        if resource not in data['resources']:
+            continue
+
+        budget = data['resources'][resource]
+        limiter = get_rate_limiter(resource)
+        limiter.update_budget(budget['limit'], budget['remaining'], budget['reset'], budget['used'])
+        budgets.append((resource, limiter.stats()))
+
+    if args.format == "text":
+        from github_cli.render import render_rate_limits
+        render_rate_limits(budgets)
+        return
+
+    writer = RecordWriter(args.format, RATELIMIT_FIELDS)
+    for resource, stats in budgets:
+        writer.write({"resource": resource, **stats})
+    writer.close()
+
+def handle_serve_command(args):
+    from github_cli.server import run_server
+
+    try:
+        run_server(args.host, args.port, args.verbose)
+    except OSError as e:
+        print(f"Error: Unable to serve on {args.host}:{args.port}. {e.strerror}", file=diagnostics())
+        sys.exit(1)
+
+COMMANDS = {
+    "search": handle_search_command,
+    "events": handle_event_command,
+    "org": handle_org_command,
+    "sync": handle_sync_command,
+    "stats": handle_stats_command,
+    "popular": handle_popular_command,
+    "ratelimit": handle_ratelimit_command,
+    "serve": handle_serve_command
+}
+
+def run(args):
+    output_settings['format'] = args.format
+    open_snapshots(args)
+
+    # The library raises GitHubError, and the command line reports it and exits.
+    try:
+        if args.pager and args.format == "text":
+            from github_cli.render import console
+            with console.pager(styles=True):
+                COMMANDS[args.command](args)
+        else:
+            COMMANDS[args.command](args)
+    except GitHubError as e:
+        print(f"Error: {e.message}", file=diagnostics())
+        sys.exit(1)
+    except BrokenPipeError:
+        # The reader went away, as `| head` does. stdout is pointed at devnull so the flush at
+        # exit does not fail again.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+    finally:
+        if args.recorder is not None:
+            args.recorder.close()
+
+    return 0
@@ -0,0 +1,42 @@
+import time
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from github_cli.profiling import stage
+
+# Setting up a new connection is timed as its own stage. It runs inside the request's fetch stage,
+# so --profile can tell the DNS, TCP and TLS time apart from the time GitHub takes to answer.
+
+class TimedConnection:
+    # connect() covers the DNS lookup, the TCP handshake and, for HTTPS, the TLS handshake.
+    # _new_conn() is the DNS and TCP part, so whatever is left is TLS.
+    def connect(self):
+        with stage("connect", host=self.host) as info:
+            self.setup = info
+            super().connect()
+
+    def _new_conn(self):
+        start = time.perf_counter()
+        try:
+            return super()._new_conn()
+        finally:
+            self.setup['tcp'] = time.perf_counter() - start
+
+class TimedHTTPConnection(TimedConnection, HTTPConnection):
+    pass
+
+class TimedHTTPSConnection(TimedConnection, HTTPSConnection):
+    pass
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+class TimedAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {"http": TimedHTTPConnectionPool, "https": TimedHTTPSConnectionPool}
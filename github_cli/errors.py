@@ -0,0 +1,7 @@
+class GitHubError(Exception):
+    # Raised when GitHub cannot be reached or answers a lookup with an error. status is the HTTP
+    # status of the response, or None when there was no response.
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.message = message
+        self.status = status
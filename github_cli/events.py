@@ -0,0 +1,208 @@
+from github_cli.profiling import timed
+from github_cli.records import (
+    Commit, Create, Delete, Fork, Issue, IssueComment, Member, Public, PullRequest,
+    PullRequestReview, Release, Watch, WikiPage, record_dict
+)
+
+def parse_push_event(event):
+    timestamp = event['created_at'][0:10]
+    return [Commit(event['repo']['name'], commit['message'], timestamp) for commit in event['payload']['commits']]
+
+def parse_pull_request_event(event):
+    return [PullRequest(
+        event['repo']['name'],
+        event['payload']['action'],
+        event['payload']['pull_request']['title'],
+        event['created_at'][0:10]
+    )]
+
+def parse_issues_event(event):
+    return [Issue(
+        event['repo']['name'],
+        event['payload']['action'],
+        event['payload']['issue']['title'],
+        event['created_at'][0:10]
+    )]
+
+def parse_fork_event(event):
+    return [Fork(event['repo']['name'], event['payload']['forkee']['full_name'], event['created_at'][0:10])]
+
+def parse_watch_event(event):
+    return [Watch(event['repo']['name'], event['payload']['action'], event['created_at'][0:10])]
+
+def parse_create_event(event):
+    return [Create(event['repo']['name'], event['created_at'][0:10])]
+
+def parse_release_event(event):
+    release = event['payload']['release']
+    return [Release(
+        event['repo']['name'],
+        release['name'],
+        release['tag_name'],
+        (release['published_at'] or event['created_at'])[0:10]
+    )]
+
+def parse_delete_event(event):
+    return [Delete(event['repo']['name'], event['payload']['ref'], event['payload']['ref_type'], event['created_at'][0:10])]
+
+def parse_gollum_event(event):
+    timestamp = event['created_at'][0:10]
+    return [WikiPage(event['repo']['name'], page['action'], page['title'], timestamp) for page in event['payload']['pages']]
+
+def parse_issue_comment_event(event):
+    return [IssueComment(
+        event['repo']['name'],
+        event['payload']['issue']['number'],
+        event['payload']['issue']['title'],
+        event['created_at'][0:10]
+    )]
+
+def parse_pull_request_review_event(event):
+    return [PullRequestReview(
+        event['repo']['name'],
+        event['payload']['review']['state'],
+        event['payload']['pull_request']['title'],
+        event['created_at'][0:10]
+    )]
+
+def parse_member_event(event):
+    return [Member(event['repo']['name'], event['payload']['action'], event['payload']['member']['login'], event['created_at'][0:10])]
+
+def parse_public_event(event):
+    return [Public(event['repo']['name'], event['created_at'][0:10])]
+
+EVENT_PARSERS = {
+    "PushEvent": parse_push_event,
+    "PullRequestEvent": parse_pull_request_event,
+    "IssuesEvent": parse_issues_event,
+    "ForkEvent": parse_fork_event,
+    "WatchEvent": parse_watch_event,
+    "CreateEvent": parse_create_event,
+    "ReleaseEvent": parse_release_event,
+    "DeleteEvent": parse_delete_event,
+    "GollumEvent": parse_gollum_event,
+    "IssueCommentEvent": parse_issue_comment_event,
+    "PullRequestReviewEvent": parse_pull_request_review_event,
+    "MemberEvent": parse_member_event,
+    "PublicEvent": parse_public_event
+}
+
+# Everything the parsers above and follow mode read from an event. The rest of each payload is dropped while decoding.
+EVENT_KEYS = {
+    "id": None,
+    "type": None,
+    "created_at": None,
+    "actor": {"login": None},
+    "repo": {"name": None},
+    "payload": {
+        "action": None,
+        "commits": {"message": None},
+        "pull_request": {"title": None},
+        "issue": {"number": None, "title": None},
+        "forkee": {"full_name": None},
+        "release": {"name": None, "tag_name": None, "published_at": None},
+        "ref": None,
+        "ref_type": None,
+        "pages": {"action": None, "title": None},
+        "review": {"state": None},
+        "member": {"login": None}
+    }
+}
+
+EVENT_FLAGS = {
+    "PushEvent": "push",
+    "PullRequestEvent": "pullrequest",
+    "IssuesEvent": "issues",
+    "ForkEvent": "fork",
+    "WatchEvent": "watch",
+    "CreateEvent": "create",
+    "ReleaseEvent": "release",
+    "DeleteEvent": "delete",
+    "GollumEvent": "gollum",
+    "IssueCommentEvent": "issuecomment",
+    "PullRequestReviewEvent": "prreview",
+    "MemberEvent": "member",
+    "PublicEvent": "public"
+}
+
+GROUPED_EVENTS = {
+    "PushEvent": "repo_msgs",
+    "PullRequestEvent": "pr_info",
+    "IssuesEvent": "issue_info",
+    "GollumEvent": "page_info",
+    "IssueCommentEvent": "comment_info",
+    "PullRequestReviewEvent": "review_info"
+}
+
+DEFAULT_EVENTS = ["PushEvent", "PullRequestEvent", "IssuesEvent", "ForkEvent", "WatchEvent"]
+
+@timed("aggregate")
+def classify_events(data, event_types):
+    parsers = {event_type: EVENT_PARSERS[event_type] for event_type in event_types}
+    collected = {event_type: {} if event_type in GROUPED_EVENTS else [] for event_type in event_types}
+
+    for event in data:
+        parser = parsers.get(event['type'])
+        if parser is None:
+            continue
+
+        records = collected[event['type']]
+        if isinstance(records, dict):
+            for record in parser(event):
+                records.setdefault(record.repo_name, []).append(record)
+        else:
+            records.extend(parser(event))
+
+    for event_type, info_key in GROUPED_EVENTS.items():
+        if event_type in collected:
+            collected[event_type] = [
+                {"repo_name": repo_name, info_key: items}
+                for repo_name, items in collected[event_type].items()
+            ]
+
+    return collected
+
+def event_rows(login, collected):
+    for event_type, info in collected.items():
+        info_key = GROUPED_EVENTS.get(event_type)
+
+        for repo in info:
+            if info_key is None:
+                yield {"user": login, "type": event_type, **record_dict(repo)}
+            else:
+                for item in repo[info_key]:
+                    yield {"user": login, "type": event_type, **record_dict(item)}
+
+def build_repo_event_info(collected, missing="Event does not exist"):
+    repo_event_info = [{"type": event_type, "info": None} for event_type in EVENT_PARSERS]
+
+    for entry in repo_event_info:
+        if entry['type'] in collected:
+            entry['info'] = collected[entry['type']] or missing
+
+    return repo_event_info
+
+def event_document(login, repo_event_info):
+    events = {}
+
+    for entry in repo_event_info:
+        if entry['info'] is None:
+            continue
+        if not isinstance(entry['info'], list):
+            events[entry['type']] = []
+            continue
+
+        info_key = GROUPED_EVENTS.get(entry['type'])
+        if info_key is None:
+            events[entry['type']] = [record_dict(record) for record in entry['info']]
+        else:
+            # The repository name is already on the group, so leave it off each item.
+            events[entry['type']] = [
+                {"repo_name": repo['repo_name'], info_key: [
+                    {name: value for name, value in record_dict(item).items() if name != "repo_name"}
+                    for item in repo[info_key]
+                ]}
+                for repo in entry['info']
+            ]
+
+    return {"user": login, "events": events}
@@ -0,0 +1,95 @@
+import json
+import re
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+decoder = json.JSONDecoder()
+
+def loads(body):
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
+
+def skip_whitespace(text, pos):
+    return WHITESPACE.match(text, pos).end()
+
+def scan_array(text, pos):
+    # Decodes one element at a time, so only the current element is ever held as objects.
+    if text[pos:pos + 1] != "[":
+        raise ValueError(f"Expected a JSON array at position {pos}")
+
+    pos = skip_whitespace(text, pos + 1)
+    if text[pos:pos + 1] == "]":
+        return pos + 1
+
+    while True:
+        item, pos = decoder.raw_decode(text, pos)
+        yield item
+
+        pos = skip_whitespace(text, pos)
+        if text[pos:pos + 1] == "]":
+            return pos + 1
+        if text[pos:pos + 1] != ",":
+            raise ValueError(f"Expected ',' or ']' at position {pos}")
+        pos = skip_whitespace(text, pos + 1)
+
+def scan_object_member(text, key, members=None):
+    pos = skip_whitespace(text, 0)
+    if text[pos:pos + 1] != "{":
+        raise ValueError("Expected a JSON object")
+
+    pos = skip_whitespace(text, pos + 1)
+    while text[pos:pos + 1] != "}":
+        name, pos = decoder.raw_decode(text, pos)
+        pos = skip_whitespace(text, pos)
+        if text[pos:pos + 1] != ":":
+            raise ValueError(f"Expected ':' at position {pos}")
+        pos = skip_whitespace(text, pos + 1)
+
+        if name == key:
+            pos = yield from scan_array(text, pos)
+        else:
+            value, pos = decoder.raw_decode(text, pos)
+            if members is not None:
+                members[name] = value
+
+        pos = skip_whitespace(text, pos)
+        if text[pos:pos + 1] == ",":
+            pos = skip_whitespace(text, pos + 1)
+
+def iter_items(body, key=None, members=None, incremental=False):
+    # By default, and always with orjson, the whole document is decoded at once, which is faster.
+    # The incremental scan is slower but never holds more than one decoded item besides the body.
+    if orjson is not None or not incremental:
+        data = loads(body)
+        if key is None:
+            yield from data
+            return
+        if members is not None:
+            members.update((name, value) for name, value in data.items() if name != key)
+        yield from data.get(key, [])
+        return
+
+    text = body.decode("utf-8") if isinstance(body, bytes) else body
+    if key is None:
+        yield from scan_array(text, skip_whitespace(text, 0))
+    else:
+        yield from scan_object_member(text, key, members)
+
+def project(value, keys):
+    # keys maps each kept field to None (keep as is) or to the keys to keep inside it.
+    if isinstance(value, list):
+        return [project(item, keys) for item in value]
+    if not isinstance(value, dict):
+        return value
+
+    return {
+        key: value[key] if inner is None else project(value[key], inner)
+        for key, inner in keys.items()
+        if key in value
+    }
@@ -0,0 +1,69 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+class SingleFlight:
+    # Identical requests that arrive while one is running wait for its result instead of repeating it.
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls = {}
+        self.shared = 0
+
+    def do(self, key, function):
+        with self.lock:
+            future = self.calls.get(key)
+            leader = future is None
+            if leader:
+                future = self.calls[key] = Future()
+            else:
+                self.shared += 1
+
+        if leader:
+            try:
+                future.set_result(function())
+            except BaseException as e:
+                future.set_exception(e)
+            finally:
+                with self.lock:
+                    del self.calls[key]
+
+        return future.result()
+
+class Memo:
+    # Decoded responses kept in memory, least recently used first out. Entries expire like the
+    # on-disk cache does, so a long-lived process does not keep answering with old data.
+    def __init__(self, size, ttl):
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.flights = SingleFlight()
+        self.size = size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, function):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+
+        return self.flights.do(key, lambda: self.load(key, function))
+
+    def load(self, key, function):
+        value = function()
+
+        with self.lock:
+            self.misses += 1
+            self.entries[key] = (time.monotonic() + self.ttl, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+
+        return value
+
+    def stats(self):
+        with self.lock:
+            return {"hits": self.hits, "misses": self.misses, "shared": self.flights.shared, "entries": len(self.entries)}
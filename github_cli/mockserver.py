@@ -0,0 +1,532 @@
+import argparse
+import functools
+import hashlib
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from github_cli.query import RANGE_QUALIFIERS, parse_query, parse_range
+
+# A stand-in for the parts of the GitHub REST API this tool uses, serving synthetic but
+# GitHub-shaped fixtures. Run it with `python -m github_cli.mockserver` and point the CLI
+# at it with --api-url or GITHUB_API_URL.
+
+LANGUAGES = ["Python", "Go", "Rust", "JavaScript", "TypeScript", "C", "Java", "Ruby"]
+
+TOPICS = ["cli", "web", "database", "machine-learning", "devtools", "security"]
+
+EVENT_TYPES = [
+    "PushEvent", "PullRequestEvent", "IssuesEvent", "ForkEvent", "WatchEvent", "CreateEvent", "ReleaseEvent",
+    "DeleteEvent", "GollumEvent", "IssueCommentEvent", "PullRequestReviewEvent", "MemberEvent", "PublicEvent"
+]
+
+fixtures = {
+    "events_per_user": 300,
+    "repo_count": 2500,
+    "members_per_org": 25,
+    "missing_users": set(),
+    "latency": 0,
+    "fixtures_dir": None,
+    "rate_limited": 0,
+    "rate_limit": "retry-after",
+    "retry_after": 1
+}
+
+fixtures_lock = threading.Lock()
+
+RATE_LIMITS = ["primary", "secondary", "retry-after"]
+
+def recorded_response(path):
+    # A response saved as <fixtures dir>/<path>.json, such as users/octocat.json, is served instead
+    # of the synthetic one. A recorded list is paginated like the synthetic lists are.
+    if fixtures['fixtures_dir'] is None:
+        return None
+
+    file_path = os.path.join(fixtures['fixtures_dir'], *[part for part in path.split("/") if part]) + ".json"
+    try:
+        with open(file_path) as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return None
+
+def api_links(base, path, names):
+    return {f"{name}_url": f"{base}{path}/{name}" for name in names}
+
+def user_summary(login, user_id):
+    return {
+        "login": login,
+        "id": user_id,
+        "node_id": f"U_{user_id:08d}",
+        "avatar_url": f"https://avatars.githubusercontent.com/u/{user_id}?v=4",
+        "gravatar_id": "",
+        "url": f"https://api.github.com/users/{login}",
+        "html_url": f"https://github.com/{login}",
+        **api_links("https://api.github.com/users/", login, ["followers", "following", "gists", "starred", "subscriptions", "organizations", "repos", "events", "received_events"]),
+        "type": "User",
+        "site_admin": False
+    }
+
+def user_profile(login):
+    user_id = int(hashlib.md5(login.encode()).hexdigest()[:6], 16)
+    return {
+        **user_summary(login, user_id),
+        "name": login.title(),
+        "company": None,
+        "blog": "",
+        "location": "Earth",
+        "email": None,
+        "hireable": None,
+        "bio": f"Synthetic profile for {login}.",
+        "twitter_username": None,
+        "public_repos": user_id % 120,
+        "public_gists": user_id % 7,
+        "followers": user_id % 5000,
+        "following": user_id % 90,
+        "created_at": "2015-03-14T09:26:53Z",
+        "updated_at": "2026-01-02T03:04:05Z"
+    }
+
+def graphql_user(login):
+    profile = user_profile(login)
+    return {
+        "login": profile['login'],
+        "name": profile['name'],
+        "url": profile['html_url'],
+        "bio": profile['bio'],
+        "location": profile['location'],
+        "email": "",
+        "twitterUsername": None,
+        "followers": {"totalCount": profile['followers']},
+        "following": {"totalCount": profile['following']},
+        "createdAt": profile['created_at'],
+        "updatedAt": profile['updated_at']
+    }
+
+def graphql_users(query, variables):
+    # Only the aliased user(login:) lookups the client batches are understood.
+    data, errors = {}, []
+    for alias, variable in re.findall(r"(\w+): user\(login: \$(\w+)\)", query):
+        login = variables.get(variable, "")
+        if login in fixtures['missing_users']:
+            data[alias] = None
+            errors.append({"type": "NOT_FOUND", "path": [alias], "message": f"Could not resolve to a User with the login of '{login}'."})
+        else:
+            data[alias] = graphql_user(login)
+
+    body = {"data": data}
+    if errors:
+        body["errors"] = errors
+    return body
+
+def repository(index):
+    owner = f"owner{index % 97}"
+    name = f"project-{index}"
+    stars = max(250000 - index * 97, 0)
+    created = 2009 + index % 17
+
+    return {
+        "id": 100000 + index,
+        "node_id": f"R_{index:08d}",
+        "name": name,
+        "full_name": f"{owner}/{name}",
+        "private": False,
+        "owner": user_summary(owner, index % 97),
+        "html_url": f"https://github.com/{owner}/{name}",
+        "description": f"Synthetic repository number {index} for offline runs.",
+        "fork": False,
+        "url": f"https://api.github.com/repos/{owner}/{name}",
+        **api_links(f"https://api.github.com/repos/{owner}/", name, ["forks", "keys", "collaborators", "teams", "hooks", "issue_events", "events", "assignees", "branches", "tags", "blobs", "git_tags", "git_refs", "trees", "statuses", "languages", "stargazers", "contributors", "subscribers", "subscription", "commits", "git_commits", "comments", "issue_comment", "contents", "compare", "merges", "archive", "downloads", "issues", "pulls", "milestones", "notifications", "labels", "releases", "deployments"]),
+        "created_at": f"{created}-0{1 + index % 9}-1{index % 10}T08:00:00Z",
+        "updated_at": "2026-09-30T12:00:00Z",
+        "pushed_at": f"{2020 + index % 7}-0{1 + index % 9}-2{index % 8}T10:00:00Z",
+        "homepage": None,
+        "size": index * 13 % 90000,
+        "stargazers_count": stars,
+        "watchers_count": stars,
+        "language": LANGUAGES[index % len(LANGUAGES)],
+        "forks_count": stars // 7,
+        "open_issues_count": index % 300,
+        "license": {"key": "mit", "name": "MIT License", "spdx_id": "MIT", "url": "https://api.github.com/licenses/mit", "node_id": "MDc6TGljZW5zZTEz"},
+        "topics": [TOPICS[index % len(TOPICS)], TOPICS[index * 7 % len(TOPICS)]],
+        "visibility": "public",
+        "default_branch": "main",
+        "score": 1.0
+    }
+
+def repository_index(owner, name):
+    match = re.fullmatch(r"project-(\d+)", name)
+    if match is None or int(match.group(1)) >= fixtures['repo_count'] or owner != f"owner{int(match.group(1)) % 97}":
+        return None
+    return int(match.group(1))
+
+def languages(index):
+    primary = LANGUAGES[index % len(LANGUAGES)]
+    secondary = LANGUAGES[(index + 3) % len(LANGUAGES)]
+    return {primary: 400000 + index * 1000, secondary: 30000 + index * 10, "Shell": 1200}
+
+def latest_release(index):
+    # Every fourth repository has no releases.
+    if index % 4 == 3:
+        return None
+    return {
+        "tag_name": f"v{1 + index % 5}.{index % 10}.0",
+        "name": f"Release {1 + index % 5}.{index % 10}",
+        "draft": False,
+        "prerelease": False,
+        "created_at": f"2026-0{1 + index % 9}-0{1 + index % 9}T12:00:00Z",
+        "published_at": f"2026-0{1 + index % 9}-0{1 + index % 9}T12:00:00Z",
+        "body": "Synthetic release notes."
+    }
+
+def contributors(index):
+    # Every twenty-fifth repository is too large for GitHub to list its contributors.
+    if index % 25 == 24:
+        return None
+    return [{**user_summary(f"contributor{serial}", serial), "contributions": 1000 - serial} for serial in range(1 + index * 37 % 400)]
+
+def participation(index):
+    # Every tenth repository is still being computed, which GitHub answers with 202.
+    if index % 10 == 7:
+        return None
+    weekly = [(index + week * 7) % 23 for week in range(52)]
+    return {"all": weekly, "owner": [count // 3 for count in weekly]}
+
+def event(login, serial, created_at):
+    rnd = random.Random(f"{login}/{serial}")
+    event_type = EVENT_TYPES[serial % len(EVENT_TYPES)]
+    repo_name = f"{login}/repo{rnd.randint(0, 9)}"
+    title = f"{event_type[:-5]} change number {serial}"
+
+    if event_type == "PushEvent":
+        payload = {
+            "push_id": serial,
+            "size": 3,
+            "distinct_size": 3,
+            "ref": "refs/heads/main",
+            "head": hashlib.sha1(f"{serial}head".encode()).hexdigest(),
+            "before": hashlib.sha1(f"{serial}before".encode()).hexdigest(),
+            "commits": [
+                {
+                    "sha": hashlib.sha1(f"{serial}/{k}".encode()).hexdigest(),
+                    "author": {"email": f"{login}@users.noreply.github.com", "name": login},
+                    "message": f"Commit {k} of push {serial}",
+                    "distinct": True,
+                    "url": f"https://api.github.com/repos/{repo_name}/commits/{serial}{k}"
+                }
+                for k in range(3)
+            ]
+        }
+    elif event_type in ("PullRequestEvent", "PullRequestReviewEvent"):
+        pull_request = {"number": serial, "title": title, "state": "open", "body": "Synthetic pull request body. " * 20, "user": user_summary(login, serial)}
+        payload = {"action": rnd.choice(["opened", "closed", "reopened"]), "number": serial, "pull_request": pull_request}
+        if event_type == "PullRequestReviewEvent":
+            payload = {"action": "created", "review": {"state": rnd.choice(["approved", "changes_requested", "commented"]), "body": None}, "pull_request": pull_request}
+    elif event_type in ("IssuesEvent", "IssueCommentEvent"):
+        issue = {"number": serial, "title": title, "state": "open", "body": "Synthetic issue body. " * 20, "user": user_summary(login, serial)}
+        payload = {"action": rnd.choice(["opened", "closed"]), "issue": issue}
+        if event_type == "IssueCommentEvent":
+            payload = {"action": "created", "issue": issue, "comment": {"body": "Synthetic comment.", "user": user_summary(login, serial)}}
+    elif event_type == "ForkEvent":
+        payload = {"forkee": {"full_name": f"{login}/fork-{serial}", "private": False}}
+    elif event_type == "WatchEvent":
+        payload = {"action": "started"}
+    elif event_type == "CreateEvent":
+        payload = {"ref": None, "ref_type": "repository", "master_branch": "main", "description": None}
+    elif event_type == "ReleaseEvent":
+        release = {
+            "id": serial,
+            "tag_name": f"v{serial}",
+            "target_commitish": "main",
+            "name": f"Release {serial}",
+            "draft": False,
+            "prerelease": False,
+            "created_at": created_at,
+            "published_at": created_at,
+            "body": "Synthetic release notes. " * 10,
+            "author": user_summary(login, serial)
+        }
+        payload = {"action": "published", "release": release}
+    elif event_type == "DeleteEvent":
+        payload = {"ref": f"feature-{serial}", "ref_type": "branch"}
+    elif event_type == "GollumEvent":
+        payload = {"pages": [{"page_name": f"Page-{serial}", "title": f"Page {serial}", "action": "edited", "sha": "0" * 40}]}
+    elif event_type == "MemberEvent":
+        payload = {"action": "added", "member": user_summary(f"friend{serial % 5}", serial)}
+    else:
+        payload = {}
+
+    return {
+        # Event ids are unique across users on GitHub, and grow over time.
+        "id": str(30000000000 + serial * 1000 + int(hashlib.md5(login.encode()).hexdigest()[:6], 16) % 1000),
+        "type": event_type,
+        "actor": user_summary(login, serial),
+        "repo": {"id": serial, "name": repo_name, "url": f"https://api.github.com/repos/{repo_name}"},
+        "payload": payload,
+        "public": True,
+        "created_at": created_at
+    }
+
+@functools.cache
+def repositories(count):
+    return [repository(index) for index in range(count)]
+
+def user_events(login):
+    # Newest first, one event per hour ending now, like the real feed.
+    now = int(time.time()) // 3600 * 3600
+    count = fixtures['events_per_user']
+
+    return [
+        event(login, serial, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now - (count - serial) * 3600)))
+        for serial in range(count, 0, -1)
+    ]
+
+def matches(repo, terms):
+    # Like GitHub, several language qualifiers match any of them, while every other qualifier must hold.
+    languages = {value.lower() for qualifier, value in terms if qualifier == "language"}
+    if languages and repo['language'].lower() not in languages:
+        return False
+
+    for qualifier, value in terms:
+        if qualifier == "topic" and value.lower() not in repo['topics']:
+            return False
+        if qualifier in RANGE_QUALIFIERS:
+            field = {"stars": "stargazers_count", "forks": "forks_count", "created": "created_at", "pushed": "pushed_at"}[qualifier]
+            lower, upper = parse_range(value, RANGE_QUALIFIERS[qualifier])
+            actual = repo[field] if isinstance(repo[field], int) else RANGE_QUALIFIERS[qualifier](repo[field][0:10])
+            if (lower is not None and actual < lower) or (upper is not None and actual > upper):
+                return False
+    return True
+
+def search_repositories(params):
+    terms = parse_query(params.get("q", ""))
+    repos = [repo for repo in repositories(fixtures['repo_count']) if matches(repo, terms)]
+
+    sort_field = {"stars": "stargazers_count", "forks": "forks_count", "updated": "updated_at", "help-wanted-issues": "open_issues_count"}.get(params.get("sort"))
+    if sort_field is not None:
+        repos.sort(key=lambda repo: repo[sort_field], reverse=params.get("order", "desc") == "desc")
+
+    return len(repos), repos[:1000]
+
+def paginate(items, params, default_per_page=30):
+    per_page = min(int(params.get("per_page", default_per_page)), 100)
+    page = int(params.get("page", 1))
+    last_page = max((len(items) + per_page - 1) // per_page, 1)
+    return items[(page - 1) * per_page:page * per_page], page, per_page, last_page
+
+class Handler(BaseHTTPRequestHandler):
+    server_version = "github-mock"
+    # Keep-alive like GitHub, so clients reuse their pooled connections. The headers and the body
+    # are written separately, and with Nagle's algorithm on a reused connection the body would wait
+    # out the client's delayed ACK, about 40 ms per response.
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        url = urllib.parse.urlsplit(self.path)
+        params = dict(urllib.parse.parse_qsl(url.query))
+        parts = [part for part in url.path.split("/") if part]
+        headers = {
+            "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Remaining": "4999",
+            "X-RateLimit-Used": "1",
+            "X-RateLimit-Reset": str(int(time.time()) + 3600),
+            "X-RateLimit-Resource": "search" if parts[:1] == ["search"] else "core"
+        }
+
+        if fixtures['latency']:
+            time.sleep(fixtures['latency'])
+
+        if self.reply_rate_limited(headers):
+            return
+
+        recorded = recorded_response(url.path)
+        if isinstance(recorded, list):
+            page_items, page, per_page, last_page = paginate(recorded, params)
+            self.add_links(headers, url.path, params, page, per_page, last_page)
+            return self.reply(200, page_items, headers)
+        if recorded is not None:
+            return self.reply(200, recorded, headers)
+
+        if parts == ["rate_limit"]:
+            reset = int(time.time()) + 3600
+            body = {"resources": {resource: {"limit": limit, "remaining": limit, "reset": reset, "used": 0} for resource, limit in [("core", 5000), ("search", 30), ("graphql", 5000)]}}
+            return self.reply(200, body, headers)
+
+        if len(parts) == 2 and parts[0] == "users":
+            if parts[1] in fixtures['missing_users']:
+                return self.reply(404, {"message": "Not Found"}, headers)
+            return self.reply(200, user_profile(parts[1]), headers)
+
+        if len(parts) == 3 and parts[0] == "users" and parts[2] == "events":
+            if parts[1] in fixtures['missing_users']:
+                return self.reply(404, {"message": "Not Found"}, headers)
+
+            # Like GitHub, only the newest 300 events are served.
+            page_events, page, per_page, last_page = paginate(user_events(parts[1])[:300], params)
+            self.add_links(headers, url.path, params, page, per_page, last_page)
+            headers["X-Poll-Interval"] = "60"
+            return self.reply(200, page_events, headers)
+
+        if len(parts) == 3 and parts[0] == "orgs" and parts[2] == "members":
+            if parts[1] in fixtures['missing_users']:
+                return self.reply(404, {"message": "Not Found"}, headers)
+
+            members = [user_summary(f"{parts[1]}-member{serial}", serial) for serial in range(fixtures['members_per_org'])]
+            page_members, page, per_page, last_page = paginate(members, params)
+            self.add_links(headers, url.path, params, page, per_page, last_page)
+            return self.reply(200, page_members, headers)
+
+        if len(parts) >= 4 and parts[0] == "repos":
+            index = repository_index(parts[1], parts[2])
+            if index is None:
+                return self.reply(404, {"message": "Not Found"}, headers)
+
+            if parts[3:] == ["languages"]:
+                return self.reply(200, languages(index), headers)
+            if parts[3:] == ["releases", "latest"]:
+                release = latest_release(index)
+                return self.reply(200, release, headers) if release else self.reply(404, {"message": "Not Found"}, headers)
+            if parts[3:] == ["contributors"]:
+                if contributors(index) is None:
+                    return self.reply(403, {"message": "The history or contributor list is too large to list contributors for this repository via the API."}, headers)
+                page_contributors, page, per_page, last_page = paginate(contributors(index), params)
+                self.add_links(headers, url.path, params, page, per_page, last_page)
+                return self.reply(200, page_contributors, headers)
+            if parts[3:] == ["stats", "participation"]:
+                weekly = participation(index)
+                return self.reply(200, weekly, headers) if weekly else self.reply(202, {}, headers)
+
+        if parts == ["search", "repositories"]:
+            try:
+                total, repos = search_repositories(params)
+            except ValueError as e:
+                return self.reply(422, {"message": f"Validation Failed: {e}"}, headers)
+            page_repos, _, _, _ = paginate(repos, params)
+            return self.reply(200, {"total_count": total, "incomplete_results": False, "items": page_repos}, headers)
+
+        self.reply(404, {"message": "Not Found"}, headers)
+
+    def do_POST(self):
+        headers = {"X-RateLimit-Resource": "graphql"}
+
+        if fixtures['latency']:
+            time.sleep(fixtures['latency'])
+
+        if self.reply_rate_limited(headers):
+            return
+
+        if urllib.parse.urlsplit(self.path).path.rstrip("/") != "/graphql":
+            return self.reply(404, {"message": "Not Found"}, headers)
+        if not self.headers.get("Authorization"):
+            return self.reply(401, {"message": "This endpoint requires you to be authenticated."}, headers)
+
+        try:
+            request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        except ValueError:
+            return self.reply(400, {"message": "Problems parsing JSON"}, headers)
+
+        self.reply(200, graphql_users(request.get("query", ""), request.get("variables") or {}), headers)
+
+    def reply_rate_limited(self, headers):
+        # The next --rate-limited requests are refused the way GitHub refuses them: an exhausted
+        # budget (403 with X-RateLimit-Remaining: 0), a secondary limit without a hint (403), or
+        # a secondary limit with Retry-After (429).
+        with fixtures_lock:
+            if fixtures['rate_limited'] <= 0:
+                return False
+            fixtures['rate_limited'] -= 1
+
+        wait = fixtures['retry_after']
+        if fixtures['rate_limit'] == "primary":
+            headers.update({"X-RateLimit-Limit": "60", "X-RateLimit-Remaining": "0", "X-RateLimit-Used": "60", "X-RateLimit-Reset": str(int(time.time() + wait))})
+            self.reply(403, {"message": "API rate limit exceeded for 127.0.0.1."}, headers)
+        elif fixtures['rate_limit'] == "secondary":
+            self.reply(403, {"message": "You have exceeded a secondary rate limit. Please wait a few minutes before you try again."}, headers)
+        else:
+            self.reply(429, {"message": "You have exceeded a secondary rate limit."}, {**headers, "Retry-After": str(wait)})
+        return True
+
+    def add_links(self, headers, path, params, page, per_page, last_page):
+        if page < last_page:
+            headers["Link"] = ", ".join([
+                f'<{self.page_url(path, params, page + 1, per_page)}>; rel="next"',
+                f'<{self.page_url(path, params, last_page, per_page)}>; rel="last"'
+            ])
+
+    def page_url(self, path, params, page, per_page):
+        query = urllib.parse.urlencode(dict(params, per_page=per_page, page=page))
+        return f"http://{self.headers.get('Host')}{path}?{query}"
+
+    def reply(self, status, body, headers):
+        data = json.dumps(body).encode()
+        etag = f'"{hashlib.sha1(data).hexdigest()}"'
+
+        if status == 200 and self.headers.get("If-None-Match") == etag:
+            status, data = 304, b""
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.send_header("ETag", etag)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+def serve(host="127.0.0.1", port=8000, verbose=False):
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    server.verbose = verbose
+    return server
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve synthetic GitHub API responses for offline runs")
+    parser.add_argument("--host", action="store", default="127.0.0.1")
+    parser.add_argument("--port", action="store", type=int, default=8000)
+    parser.add_argument("--events", action="store", type=int, default=300)
+    parser.add_argument("--repos", action="store", type=int, default=2500)
+    parser.add_argument("--members", action="store", type=int, default=25)
+    parser.add_argument("--missing", action="append", default=[])
+    parser.add_argument("--latency", action="store", type=float, default=0)
+    parser.add_argument("--fixtures", action="store")
+    parser.add_argument("--rate-limited", action="store", type=int, default=0)
+    parser.add_argument("--rate-limit", action="store", choices=RATE_LIMITS, default="retry-after")
+    parser.add_argument("--retry-after", action="store", type=int, default=1)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args(argv)
+
+    fixtures.update(
+        events_per_user=args.events,
+        repo_count=args.repos,
+        members_per_org=args.members,
+        missing_users=set(args.missing),
+        latency=args.latency / 1000,
+        fixtures_dir=args.fixtures,
+        rate_limited=args.rate_limited,
+        rate_limit=args.rate_limit,
+        retry_after=args.retry_after
+    )
+
+    server = serve(args.host, args.port, args.verbose)
+    print(f"Serving the mock GitHub API on http://{args.host}:{server.server_port}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,55 @@
+import csv
+import json
+import sys
+import threading
+from dataclasses import fields
+
+from github_cli.records import Repo, RepoDetails, User
+
+USER_FIELDS = [field.name for field in fields(User)]
+
+REPO_FIELDS = [field.name for field in fields(Repo)]
+
+ENRICHED_REPO_FIELDS = REPO_FIELDS + [field.name for field in fields(RepoDetails) if field.name != "full_name"]
+
+EVENT_FIELDS = ["user", "type", "repo_name", "timestamp", "action", "title", "number", "state", "message", "member", "forked_repo_name", "release_name", "tag_name", "ref", "ref_type"]
+
+STATS_FIELDS = ["metric", "key", "value"]
+
+SYNC_FIELDS = ["user", "new_events", "stored_events"]
+
+RATELIMIT_FIELDS = ["resource", "limit", "remaining", "used", "reset"]
+
+settings = {
+    "format": "text"
+}
+
+def diagnostics():
+    # Errors and notices share stdout with text output. In the other formats stdout carries
+    # records, so they go to stderr and never end up inside a JSON document or CSV file.
+    return sys.stdout if settings['format'] == "text" else sys.stderr
+
+class RecordWriter:
+    def __init__(self, output_format, fieldnames):
+        self.format = output_format
+        self.lock = threading.Lock()
+        self.records = []
+
+        if output_format == "csv":
+            self.csv_writer = csv.DictWriter(sys.stdout, fieldnames=fieldnames, extrasaction="ignore", lineterminator="\n")
+            self.csv_writer.writeheader()
+
+    def write(self, record):
+        with self.lock:
+            if self.format == "json":
+                self.records.append(record)
+            elif self.format == "ndjson":
+                sys.stdout.write(json.dumps(record) + "\n")
+                sys.stdout.flush()
+            else:
+                self.csv_writer.writerow(record)
+
+    def close(self):
+        if self.format == "json":
+            json.dump(self.records, sys.stdout, indent=2)
+            sys.stdout.write("\n")
@@ -0,0 +1,127 @@
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+# Callables run as hook(stage, start, duration, self_duration, info) whenever a stage finishes.
+hooks = []
+
+local = threading.local()
+
+def add_hook(hook):
+    hooks.append(hook)
+
+def remove_hook(hook):
+    hooks.remove(hook)
+
+@contextmanager
+def stage(name, **info):
+    # info is yielded so the caller can add details, like byte counts, once they are known.
+    if not hooks:
+        yield info
+        return
+
+    stack = getattr(local, "stack", None)
+    if stack is None:
+        stack = local.stack = []
+
+    # Time spent in stages nested inside this one is subtracted to get its self time.
+    nested = [0.0]
+    stack.append(nested)
+    start = time.perf_counter()
+
+    try:
+        yield info
+    finally:
+        duration = time.perf_counter() - start
+        stack.pop()
+        if stack:
+            stack[-1][0] += duration
+
+        for hook in list(hooks):
+            hook(name, start, duration, duration - nested[0], info)
+
+def timed(name):
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with stage(name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorate
+
+class Profiler:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.stages = {}
+        self.trace = []
+        self.connecting = {}
+
+    def __call__(self, name, start, duration, self_duration, info):
+        with self.lock:
+            # A connection set up for a request finishes before the request's fetch stage does,
+            # on the same thread, so its time is carried over to that request.
+            if name == "connect":
+                self.connecting[threading.get_ident()] = self.connecting.get(threading.get_ident(), 0) + duration
+            elif name == "fetch":
+                info = dict(info, connect=self.connecting.pop(threading.get_ident(), 0))
+
+            totals = self.stages.setdefault(name, {"calls": 0, "total": 0.0, "self": 0.0, "bytes": 0})
+            totals['calls'] += 1
+            totals['total'] += duration
+            totals['self'] += self_duration
+            totals['bytes'] += info.get('bytes', 0)
+
+            self.trace.append({
+                "name": name,
+                "ph": "X",
+                "ts": round((start - self.started) * 1e6),
+                "dur": round(duration * 1e6),
+                "pid": 0,
+                "tid": threading.get_ident(),
+                "args": info
+            })
+
+    def summary(self):
+        wall = time.perf_counter() - self.started
+        lines = [f"{'Stage':<12}{'Calls':>8}{'Total s':>11}{'Self s':>11}{'Bytes':>12}"]
+
+        for name, totals in sorted(self.stages.items(), key=lambda item: item[1]['self'], reverse=True):
+            lines.append(f"{name:<12}{totals['calls']:>8}{totals['total']:>11.3f}{totals['self']:>11.3f}{totals['bytes']:>12}")
+
+        lines.append(f"Wall time {wall:.3f} s")
+
+        # Lookups answered by a `serve` daemon are listed apart, since their connections and
+        # timings say nothing about the requests made to GitHub.
+        requests = [entry for entry in self.trace if entry['name'] == "fetch"]
+        hops = [entry for entry in self.trace if entry['name'] == "server"]
+        connects = [entry['args'] | {"dur": entry['dur'] / 1e6} for entry in self.trace if entry['name'] == "connect"]
+        if requests:
+            reused = sum(1 for entry in requests if not entry['args'].get('connect'))
+            setup = sum(connect['dur'] for connect in connects)
+            tcp = sum(connect.get('tcp', 0) for connect in connects)
+            lines.append(f"Connections {len(connects)} new, {setup:.3f} s setting up ({tcp:.3f} s DNS and TCP, {setup - tcp:.3f} s TLS), {reused} of {len(requests)} requests on a reused one")
+        if hops:
+            lines.append(f"Server {len(hops)} lookups answered by the github-cli server in {sum(entry['dur'] for entry in hops) / 1e6:.3f} s")
+
+        if requests or hops:
+            # Wait is the time GitHub took to answer, without setting up the connection.
+            lines.append("")
+            lines.append(f"{'Status':<8}{'Connect ms':>11}{'Wait ms':>9}{'Total ms':>10}{'Bytes':>10}  URL")
+        for entry in requests:
+            info = entry['args']
+            connect = info.get('connect', 0)
+            wait = max(info.get('wait', 0) - connect, 0)
+            lines.append(f"{info.get('status', '-'):<8}{connect * 1000:>11.1f}{wait * 1000:>9.1f}{entry['dur'] / 1000:>10.1f}{info.get('bytes', 0):>10}  {info['url']}")
+        for entry in hops:
+            info = entry['args']
+            lines.append(f"{info.get('status', '-'):<8}{'-':>11}{'-':>9}{entry['dur'] / 1000:>10.1f}{info.get('bytes', 0):>10}  {info['url']}")
+
+        return lines
+
+    def dump_trace(self, path):
+        # Chrome trace event format, which chrome://tracing and Perfetto can open.
+        with self.lock, open(path, "w") as file:
+            json.dump({"traceEvents": self.trace}, file)
@@ -0,0 +1,106 @@
+import datetime
+import re
+
+# Qualifiers that take a range. Each maps to the parser for its values.
+RANGE_QUALIFIERS = {
+    "stars": int,
+    "forks": int,
+    "created": datetime.date.fromisoformat,
+    "pushed": datetime.date.fromisoformat
+}
+
+TERM = re.compile(r'(?:([a-z][a-z-]*):)?("[^"]*"|\S+)', re.IGNORECASE)
+RANGE = re.compile(r"^(?:(>=|>|<=|<)(.+)|(.+?)\.\.(.+)|(.+))$")
+
+def step(value, direction):
+    if isinstance(value, datetime.date):
+        return value + datetime.timedelta(days=direction)
+    return value + direction
+
+def parse_range(text, parse_value):
+    # Returns inclusive (lower, upper) bounds, with None for an open end.
+    match = RANGE.match(text.strip())
+    if match is None:
+        raise ValueError(f"Invalid range: {text}")
+
+    operator, operand, lower, upper, exact = match.groups()
+    value = lambda part: None if part == "*" else parse_value(part)
+
+    if operator == ">=":
+        return value(operand), None
+    if operator == ">":
+        return step(value(operand), 1), None
+    if operator == "<=":
+        return None, value(operand)
+    if operator == "<":
+        return None, step(value(operand), -1)
+    if exact is not None:
+        return value(exact), value(exact)
+    return value(lower), value(upper)
+
+def intersect(bounds, other):
+    lower = max((bound for bound in (bounds[0], other[0]) if bound is not None), default=None)
+    upper = min((bound for bound in (bounds[1], other[1]) if bound is not None), default=None)
+    return lower, upper
+
+def format_range(bounds):
+    lower, upper = bounds
+    if lower is not None and upper is not None:
+        return str(lower) if lower == upper else f"{lower}..{upper}"
+    if lower is not None:
+        return f">={lower}"
+    if upper is not None:
+        return f"<={upper}"
+    return None
+
+def quote(value):
+    return f'"{value}"' if " " in value else value
+
+def parse_query(query):
+    terms = []
+
+    for match in TERM.finditer(query):
+        qualifier, value = match.groups()
+        terms.append(((qualifier or "").lower(), value.strip('"')))
+
+    return terms
+
+def build_query(terms):
+    # Equivalent searches come out as the same string, so they share cache entries. Only the
+    # qualifiers are sorted: free text and operators such as OR and NOT keep their order, which
+    # is part of what they mean.
+    ranges = {}
+    given = {}
+    qualifiers = set()
+    words = []
+
+    for qualifier, value in terms:
+        if qualifier in RANGE_QUALIFIERS:
+            try:
+                bounds = parse_range(value, RANGE_QUALIFIERS[qualifier])
+            except ValueError:
+                raise ValueError(f"Invalid {qualifier} range: {value}") from None
+            ranges[qualifier] = intersect(ranges.get(qualifier, (None, None)), bounds)
+            given.setdefault(qualifier, []).append(value)
+
+            lower, upper = ranges[qualifier]
+            if lower is not None and upper is not None and lower > upper:
+                raise ValueError(f"No repository can match {" and ".join(f"{qualifier}:{value}" for value in given[qualifier])}")
+        elif qualifier:
+            qualifiers.add(f"{qualifier}:{quote(value.lower())}")
+        else:
+            words.append(quote(value))
+
+    for qualifier, bounds in ranges.items():
+        formatted = format_range(bounds)
+        if formatted is not None:
+            qualifiers.add(f"{qualifier}:{formatted}")
+
+    return " ".join(words + sorted(qualifiers))
+
+def canonical_query(query):
+    return build_query(parse_query(query))
+
+def with_range(query, qualifier, bounds):
+    # Narrows the query's range for qualifier to bounds.
+    return build_query(parse_query(query) + [(qualifier, format_range(bounds) or "*..*")])
@@ -0,0 +1,118 @@
+import random
+import threading
+import time
+
+from github_cli.errors import GitHubError
+
+class RateLimiter:
+    def __init__(self, max_rate, max_wait):
+        self.lock = threading.Lock()
+        self.max_rate = max_rate
+        self.max_wait = max_wait
+        self.tokens = max_rate
+        self.updated = time.monotonic()
+        self.limit = None
+        self.remaining = None
+        self.reset = None
+        self.used = None
+        self.blocked_until = 0
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.time()
+                if self.reset is not None and now >= self.reset:
+                    # The window rolled over, so the whole budget is available again.
+                    self.remaining = self.limit
+                    self.reset = None
+
+                tick = time.monotonic()
+                self.tokens = min(self.max_rate, self.tokens + (tick - self.updated) * self.max_rate)
+                self.updated = tick
+
+                if self.blocked_until > now:
+                    wait = self.blocked_until - now
+                elif self.remaining is not None and self.remaining <= 0 and self.reset is not None:
+                    wait = self.reset - now
+                elif self.tokens < 1:
+                    wait = (1 - self.tokens) / self.max_rate
+                else:
+                    self.tokens -= 1
+                    if self.remaining is not None:
+                        self.remaining -= 1
+                    return
+
+            self.wait(wait)
+
+    def wait(self, seconds):
+        if seconds > self.max_wait:
+            reset = time.strftime("%H:%M:%S", time.localtime(time.time() + seconds))
+            raise GitHubError(f"GitHub API rate limit exceeded. Please try again after {reset}.")
+
+        time.sleep(seconds)
+
+    def update(self, response):
+        headers = response.headers
+        if "X-RateLimit-Remaining" not in headers:
+            return
+
+        self.update_budget(
+            int(headers["X-RateLimit-Limit"]),
+            int(headers["X-RateLimit-Remaining"]),
+            int(headers["X-RateLimit-Reset"]),
+            int(headers.get("X-RateLimit-Used", 0))
+        )
+
+    def update_budget(self, limit, remaining, reset, used):
+        with self.lock:
+            # Responses can finish out of order, so within one window keep the lowest count seen.
+            if self.reset == reset and self.remaining is not None:
+                remaining = min(self.remaining, remaining)
+
+            self.limit = limit
+            self.remaining = remaining
+            self.reset = reset
+            self.used = used
+
+    def backoff(self, response, attempt):
+        retry_after = response.headers.get("Retry-After")
+
+        if retry_after is not None:
+            delay = float(retry_after)
+        elif response.headers.get("X-RateLimit-Remaining") == "0":
+            delay = int(response.headers["X-RateLimit-Reset"]) - time.time()
+        else:
+            # Secondary limits without a hint: GitHub asks for at least a minute, growing each time.
+            delay = 60 * 2 ** attempt
+
+        # Jitter keeps clients that were limited together from retrying together, but it never
+        # pushes a delay that fits within max_wait past it.
+        delay = max(delay, 1)
+        if delay <= self.max_wait:
+            delay += random.uniform(0, min(1 + delay / 10, self.max_wait - delay))
+
+        with self.lock:
+            self.blocked_until = max(self.blocked_until, time.time() + delay)
+
+        return delay
+
+    def stats(self):
+        with self.lock:
+            return {
+                "limit": self.limit,
+                "remaining": self.remaining,
+                "used": self.used,
+                "reset": self.reset
+            }
+
+def is_rate_limited(response):
+    if response.status_code == 429:
+        return True
+    if response.status_code != 403:
+        return False
+
+    return (
+        "Retry-After" in response.headers
+        or response.headers.get("X-RateLimit-Remaining") == "0"
+        or "rate limit" in response.text.lower()
+    )
@@ -0,0 +1,200 @@
+from dataclasses import dataclass, fields
+
+@dataclass(slots=True)
+class User:
+    login: str
+    name: str | None
+    html_url: str
+    bio: str | None
+    location: str | None
+    email: str | None
+    twitter_username: str | None
+    followers: int
+    following: int
+    created_at: str
+    updated_at: str
+
+    @classmethod
+    def from_json(cls, data):
+        return cls(
+            data['login'],
+            data['name'],
+            data['html_url'],
+            data['bio'],
+            data['location'],
+            data['email'],
+            data['twitter_username'],
+            data['followers'],
+            data['following'],
+            data['created_at'],
+            data['updated_at']
+        )
+
+    @classmethod
+    def from_graphql(cls, data):
+        # GraphQL gives empty strings where REST gives null, and counts as connections.
+        return cls(
+            data['login'],
+            data['name'] or None,
+            data['url'],
+            data['bio'] or None,
+            data['location'] or None,
+            data['email'] or None,
+            data['twitterUsername'] or None,
+            data['followers']['totalCount'],
+            data['following']['totalCount'],
+            data['createdAt'],
+            data['updatedAt']
+        )
+
+@dataclass(slots=True)
+class Repo:
+    name: str
+    owner: str
+    html_url: str
+    description: str | None
+    language: str | None
+    watchers_count: int
+    forks_count: int
+    stargazers_count: int
+    created_at: str
+    updated_at: str
+
+    @classmethod
+    def from_json(cls, data):
+        return cls(
+            data['name'],
+            data['owner']['login'],
+            data['html_url'],
+            data['description'],
+            data['language'],
+            data['watchers_count'],
+            data['forks_count'],
+            data['stargazers_count'],
+            data['created_at'],
+            data['updated_at']
+        )
+
+# The fields Repo.from_json reads from a search result.
+REPO_KEYS = {
+    "name": None,
+    "owner": {"login": None},
+    "html_url": None,
+    "description": None,
+    "language": None,
+    "watchers_count": None,
+    "forks_count": None,
+    "stargazers_count": None,
+    "created_at": None,
+    "updated_at": None
+}
+
+@dataclass(slots=True)
+class RepoDetails:
+    full_name: str
+    languages: dict[str, int]
+    latest_release: str | None
+    released_at: str | None
+    contributors: int | None
+    commits_last_month: int | None
+    commits_last_year: int | None
+
+    @classmethod
+    def from_json(cls, full_name, languages, release, contributors, participation):
+        return cls(
+            full_name,
+            languages,
+            release['tag_name'] if release else None,
+            release['published_at'] if release else None,
+            contributors,
+            sum(participation[-4:]) if participation else None,
+            sum(participation) if participation else None
+        )
+
+@dataclass(slots=True)
+class Commit:
+    repo_name: str
+    message: str
+    timestamp: str
+
+@dataclass(slots=True)
+class PullRequest:
+    repo_name: str
+    action: str
+    title: str
+    timestamp: str
+
+@dataclass(slots=True)
+class Issue:
+    repo_name: str
+    action: str
+    title: str
+    timestamp: str
+
+@dataclass(slots=True)
+class Fork:
+    repo_name: str
+    forked_repo_name: str
+    timestamp: str
+
+@dataclass(slots=True)
+class Watch:
+    repo_name: str
+    action: str
+    timestamp: str
+
+@dataclass(slots=True)
+class Create:
+    repo_name: str
+    timestamp: str
+
+@dataclass(slots=True)
+class Release:
+    repo_name: str
+    release_name: str | None
+    tag_name: str
+    timestamp: str
+
+@dataclass(slots=True)
+class Delete:
+    repo_name: str
+    ref: str
+    ref_type: str
+    timestamp: str
+
+@dataclass(slots=True)
+class WikiPage:
+    repo_name: str
+    action: str
+    title: str
+    timestamp: str
+
+@dataclass(slots=True)
+class IssueComment:
+    repo_name: str
+    number: int
+    title: str
+    timestamp: str
+
+@dataclass(slots=True)
+class PullRequestReview:
+    repo_name: str
+    state: str
+    title: str
+    timestamp: str
+
+@dataclass(slots=True)
+class Member:
+    repo_name: str
+    action: str
+    member: str
+    timestamp: str
+
+@dataclass(slots=True)
+class Public:
+    repo_name: str
+    timestamp: str
+
+def record_dict(record):
+    # dataclasses.asdict deep-copies every value, which is wasted work for these flat records.
+    return {field.name: getattr(record, field.name) for field in fields(record)}
@@ -0,0 +1,87 @@
+import http.client
+import json
+import os
+import urllib.parse
+
+from github_cli.cache import default_cache_dir
+from github_cli.errors import GitHubError
+from github_cli.profiling import stage
+from github_cli.records import Repo, User
+
+# The client side of `serve`. Only the standard library is used, so a CLI run that a server
+# answers skips loading requests and opening its own connections to GitHub.
+
+def state_path():
+    return os.path.join(default_cache_dir(), "server.json")
+
+def find_server(api_url):
+    # The URL of a running server that talks to the same API, or None.
+    try:
+        with open(state_path()) as file:
+            state = json.load(file)
+    except (OSError, ValueError):
+        return None
+
+    if state.get('api_url') != api_url:
+        return None
+
+    # The file outlives a server that was killed, so check that something still answers.
+    try:
+        status, data = request(state['url'], "/health", timeout=0.5)
+        health = json.loads(data)
+    except (OSError, ValueError, KeyError, http.client.HTTPException):
+        return None
+
+    return state['url'] if status == 200 and health.get('pid') == state.get('pid') else None
+
+def request(server, path, timeout=None):
+    # http.client rather than urllib, which would load the system CA certificates on first use.
+    address = urllib.parse.urlsplit(server)
+    connection = http.client.HTTPConnection(address.hostname, address.port, timeout=timeout)
+    try:
+        connection.request("GET", path)
+        response = connection.getresponse()
+        return response.status, response.read()
+    finally:
+        connection.close()
+
+def server_get(server, path, params):
+    # Timed as a stage of its own: each lookup is a short-lived local connection, which would
+    # only blur the --profile numbers of the requests made to GitHub.
+    path = f"{path}?{urllib.parse.urlencode(params, doseq=True)}"
+
+    with stage("server", url=f"{server}{path}") as info:
+        try:
+            status, data = request(server, path)
+        except (OSError, http.client.HTTPException) as e:
+            raise GitHubError(f"Lost the connection to the github-cli server at {server}. {e}") from None
+        info.update(status=status, bytes=len(data))
+
+    if status != 200:
+        try:
+            message = json.loads(data).get('message')
+        except ValueError:
+            message = None
+        raise GitHubError(message or f"The github-cli server returned status {status}.", status)
+
+    with stage("decode", bytes=len(data)):
+        return json.loads(data)
+
+def get_users(server, usernames, backend="rest"):
+    body = server_get(server, "/users", {"login": usernames, "backend": backend})
+    return [None if user is None else User(**user) for user in body['users']]
+
+def fetch_github_activity(server, username, max_pages=None, max_events=None):
+    params = {"login": username}
+    if max_pages is not None:
+        params["max_pages"] = max_pages
+    if max_events is not None:
+        params["max_events"] = max_events
+    return iter(server_get(server, "/events", params)['events'])
+
+def fetch_org_members(server, org):
+    return server_get(server, "/members", {"org": org})['members']
+
+def search_repositories(server, query, limit=30, concurrency=8, sort="stars", order="desc"):
+    params = {"q": query, "limit": limit, "concurrency": concurrency, "sort": sort, "order": order}
+    return [Repo(**repo) for repo in server_get(server, "/search/repositories", params)['repositories']]
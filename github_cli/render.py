@@ -0,0 +1,351 @@
+import time
+
+from rich.console import Console, Group
+
+from github_cli.profiling import timed
+
+console = Console()
+
+def emit(lines):
+    # Render every line up front and write them in a single pass instead of one flush per line.
+    # render_str applies the same markup and highlighting console.print gives a plain string.
+    console.print(Group(*(console.render_str(line) for line in lines)))
+
+@timed("render")
+def render_user(username, user):
+    if user is None:
+        print(f"Error: User {username} not found.")
+        return False
+
+    lines = [""]
+    lines.append(f" [bold cyan]Displaying Github User Info of {user.login}[/bold cyan]")
+    lines.append("")
+
+    lines.append(f" [bold green]Username:[/bold green] {user.login}")
+    lines.append(f" [bold green]Name:[/bold green] {user.name or "Not provided"}")
+    lines.append(f" [bold green]Profile link:[/bold green] {user.html_url}")
+    lines.append("")
+
+    lines.append(f" [bold magenta]Bio:[/bold magenta] {user.bio or "Not provided"}")
+    lines.append(f" [bold magenta]Location:[/bold magenta] {user.location or "Not provided"}")
+    lines.append("")
+
+    lines.append(f" [bold purple]Email:[/bold purple] {user.email or "Not provided"}")
+    lines.append("")
+
+    lines.append(f" [bold blue]Twitter:[/bold blue] {user.twitter_username or "Not provided"}")
+    lines.append("")
+
+    lines.append(f" [bold orange3]Followers:[/bold orange3] [white not bold]{user.followers}")
+    lines.append(f" [bold orange3]Following:[/bold orange3] [white not bold]{user.following}")
+    lines.append("")
+
+    lines.append(f" [bold blue3]Account created on[/bold blue3] [white not bold]{user.created_at[0:10]}")
+    lines.append(f" [bold blue3]Last updated on[/bold blue3] [white not bold]{user.updated_at[0:10]}")
+    lines.append("")
+
+    emit(lines)
+
+def print_event_header(username):
+    console.print()
+    console.print("{:^100s}".format(f" [bold cyan]Displaying Github Event Activities of {username}[/bold cyan]"))
+
+def print_new_activity_header():
+    console.print()
+    console.print(f" [bold cyan]New activity at {time.strftime('%H:%M:%S')}[/bold cyan]")
+
+def print_skipped(username):
+    console.print(f" [bold red]Skipped {username}.[/bold red]")
+
+@timed("render")
+def render_events(repo_event_info):
+    lines = []
+
+    if repo_event_info[0]['info'] is None:
+        pass
+    elif repo_event_info[0]['info'] == "Event does not exist":
+        lines.append("")
+        lines.append(" [bold red]Push event not found.[/bold red]\n")
+    else:
+        lines.append("")
+        lines.append(" [bold green]Push Events[/bold green] " + "[bold green]=[/bold green]" * 80)
+        lines.append("")
+        for repo in repo_event_info[0]['info']:
+            lines.append(f" [bold cyan]Pushed {len(repo['repo_msgs'])} commit(s) to {repo['repo_name']}[/bold cyan]")
+            for message in repo['repo_msgs']:
+                lines.append(f" - [magenta][{message.timestamp}][/magenta] {message.message}.")
+            lines.append("")
+
+    if repo_event_info[1]['info'] is None:
+        pass
+    elif repo_event_info[1]['info'] == "Event does not exist":
+        lines.append("")
+        lines.append(" [bold red]PullRequest event not found.[/bold red]\n")
+    else:
+        lines.append("")
+        lines.append(" [bold green]PullRequest Events[/bold green] " + "[bold green]=[/bold green]" * 73)        
+        lines.append("")
+        for repo in repo_event_info[1]['info']:
+            lines.append(f" [bold cyan]{repo['repo_name']}[/bold cyan]")
+            for pr in repo['pr_info']:
+                lines.append(f" - [magenta][{pr.timestamp}][/magenta] {pr.action.capitalize()} PR: {pr.title}")
+            lines.append("")
+
+    if repo_event_info[2]['info'] is None:
+        pass
+    elif repo_event_info[2]['info'] == "Event does not exist":
+        lines.append("")
+        lines.append(" [bold red]Issues event not found.[/bold red]\n")
+    else:
+        lines.append("")
+        lines.append(" [bold green]Issues Events[/bold green] " + "[bold green]=[/bold green]" * 78)
+        lines.append("")
+        for repo in repo_event_info[2]['info']:
+            lines.append(f" [bold cyan]{repo['repo_name']}[/bold cyan]")
+            for issue in repo['issue_info']:
+                lines.append(f" - [magenta][{issue.timestamp}][/magenta] {issue.action.capitalize()} Issue: {issue.title}")
+            lines.append("")
+
+    if repo_event_info[3]['info'] is None:
+        pass
+    elif repo_event_info[3]['info'] == "Event does not exist":
+        lines.append("")
+        lines.append(" [bold red]Fork event not found.[/bold red]\n")
+    else:
+        lines.append("")
+        lines.append(" [bold green]Fork Events[/bold green] " + "[bold green]=[/bold green]" * 80)
+        lines.append("")
+        for repo in repo_event_info[3]['info']:
+            lines.append(f" - [magenta][{repo.timestamp}][/magenta] Forked [bold cyan]{repo.repo_name} [/bold cyan]to [bold cyan]{repo.forked_repo_name}[/bold cyan]")
+            lines.append("")
+
+    if repo_event_info[4]['info'] is None:
+        pass
+    elif repo_event_info[4]['info'] == "Event does not exist":
+        lines.append("")
+        lines.append(" [bold red]Watch event not found.[/bold red]\n")
+    else:
+        lines.append("")
+        lines.append(" [bold green]Watch Events[/bold green] " + "[bold green]=[/bold green]" * 79)
+        lines.append("")
+        for repo in repo_event_info[4]['info']:
+            lines.append(f" - [magenta][{repo.timestamp}][/magenta] Starred [bold cyan]{repo.repo_name}[/bold cyan]")
+            lines.append("")
+
+    if repo_event_info[5]['info'] is None:
+        pass
+    elif repo_event_info[5]['info'] == "Event does not exist":
+        lines.append("")
+        lines.append(" [bold red]Create event not found.[/bold red]\n")
+    else:
+        lines.append("")
+        lines.append(" [bold green]Create Events[/bold green] " + "[bold green]=[/bold green]" * 78)
+        lines.append("")
+        for repo in repo_event_info[5]['info']:
+            lines.append(f" - [magenta][{repo.timestamp}][/magenta] Created new repository [bold cyan]{repo.repo_name}[/bold cyan]")
+            lines.append("")
+
+    if repo_event_info[6]['info'] is None:
+        pass
+    elif repo_event_info[6]['info'] == "Event does not exist":
+        lines.append("")
+        lines.append(" [bold red]Release event not found.[/bold red]\n")
+    else:
+        lines.append("")
+        lines.append(" [bold green]Release Events[/bold green] " + "[bold green]=[/bold green]"* 77)
+        lines.append("")
+        for repo in repo_event_info[6]['info']:
+            lines.append(f" [bold cyan]{repo.repo_name}[/bold cyan]")
+            lines.append(f" - [magenta][{repo.timestamp}][/magenta] Release: {repo.release_name} (Tag: {repo.tag_name})")
+            lines.append("")
+
+    if repo_event_info[7]['info'] is None:
+        pass
+    elif repo_event_info[7]['info'] == "Event does not exist":
+        lines.append("")
+        lines.append(" [bold red]Delete event not found.[/bold red]\n")
+    else:
+        lines.append("")
+        lines.append(" [bold green]Delete Events[/bold green] " + "[bold green]=[/bold green]"* 78)
+        lines.append("")
+        for repo in repo_event_info[7]['info']:
+            lines.append(f" [bold cyan]{repo.repo_name}[/bold cyan]")
+            lines.append(f" - [magenta][{repo.timestamp}][/magenta] Deleted {repo.ref_type}: {repo.ref}")
+            lines.append("")
+
+    if repo_event_info[8]['info'] is None:
+        pass
+    elif repo_event_info[8]['info'] == "Event does not exist":
+        lines.append("")
+        lines.append(" [bold red]Gollum event not found.[/bold red]\n")
+    else:
+        lines.append("")
+        lines.append(" [bold green]Gollum Events[/bold green] " + "[bold green]=[/bold green]" * 78)
+        lines.append("")
+        for repo in repo_event_info[8]['info']:
+            lines.append(f" [bold cyan]{repo['repo_name']}[/bold cyan]")
+            for page in repo['page_info']:
+                lines.append(f" - [magenta][{page.timestamp}][/magenta] {page.action.capitalize()} wiki page: {page.title}")
+            lines.append("")
+
+    if repo_event_info[9]['info'] is None:
+        pass
+    elif repo_event_info[9]['info'] == "Event does not exist":
+        lines.append("")
+        lines.append(" [bold red]IssueComment event not found.[/bold red]\n")
+    else:
+        lines.append("")
+        lines.append(" [bold green]IssueComment Events[/bold green] " + "[bold green]=[/bold green]" * 72)
+        lines.append("")
+        for repo in repo_event_info[9]['info']:
+            lines.append(f" [bold cyan]{repo['repo_name']}[/bold cyan]")
+            for comment in repo['comment_info']:
+                lines.append(f" - [magenta][{comment.timestamp}][/magenta] Commented on #{comment.number}: {comment.title}")
+            lines.append("")
+
+    if repo_event_info[10]['info'] is None:
+        pass
+    elif repo_event_info[10]['info'] == "Event does not exist":
+        lines.append("")
+        lines.append(" [bold red]PullRequestReview event not found.[/bold red]\n")
+    else:
+        lines.append("")
+        lines.append(" [bold green]PullRequestReview Events[/bold green] " + "[bold green]=[/bold green]" * 67)
+        lines.append("")
+        for repo in repo_event_info[10]['info']:
+            lines.append(f" [bold cyan]{repo['repo_name']}[/bold cyan]")
+            for review in repo['review_info']:
+                lines.append(f" - [magenta][{review.timestamp}][/magenta] Reviewed PR ({review.state.replace('_', ' ')}): {review.title}")
+            lines.append("")
+
+    if repo_event_info[11]['info'] is None:
+        pass
+    elif repo_event_info[11]['info'] == "Event does not exist":
+        lines.append("")
+        lines.append(" [bold red]Member event not found.[/bold red]\n")
+    else:
+        lines.append("")
+        lines.append(" [bold green]Member Events[/bold green] " + "[bold green]=[/bold green]" * 78)
+        lines.append("")
+        for repo in repo_event_info[11]['info']:
+            lines.append(f" - [magenta][{repo.timestamp}][/magenta] {repo.action.capitalize()} collaborator [bold cyan]{repo.member}[/bold cyan] to [bold cyan]{repo.repo_name}[/bold cyan]")
+            lines.append("")
+
+    if repo_event_info[12]['info'] is None:
+        pass
+    elif repo_event_info[12]['info'] == "Event does not exist":
+        lines.append("")
+        lines.append(" [bold red]Public event not found.[/bold red]\n")
+    else:
+        lines.append("")
+        lines.append(" [bold green]Public Events[/bold green] " + "[bold green]=[/bold green]" * 78)
+        lines.append("")
+        for repo in repo_event_info[12]['info']:
+            lines.append(f" - [magenta][{repo.timestamp}][/magenta] Made [bold cyan]{repo.repo_name}[/bold cyan] public")
+            lines.append("")
+
+    emit(lines)
+
+def render_sync(username, result):
+    added, stored = result
+    console.print(f" [bold green]{username}:[/bold green] [white not bold]{added} new event(s) archived, {stored} stored.")
+
+@timed("render")
+def render_stats(stats):
+    lines = ["", f" [bold cyan]Displaying Activity Statistics for {stats['events']} Event(s)[/bold cyan]", ""]
+
+    def ranking(title, rows, unit):
+        lines.append(f" [bold green]{title}[/bold green] " + "[bold green]=[/bold green]" * (91 - len(title)))
+        lines.append("")
+        for name, count in rows:
+            lines.append(f" - [bold cyan]{name}[/bold cyan] [white not bold]{count} {unit}")
+        if not rows:
+            lines.append(" [bold red]Nothing found.[/bold red]")
+        lines.append("")
+
+    def histogram(title, rows):
+        lines.append(f" [bold green]{title}[/bold green] " + "[bold green]=[/bold green]" * (91 - len(title)))
+        lines.append("")
+        peak = max((count for _, count in rows), default=0)
+        for label, count in rows:
+            bar = "█" * round(count / peak * 50) if peak else ""
+            lines.append(f" [magenta]{label:>10}[/magenta] [yellow]{bar}[/yellow] {count}")
+        lines.append("")
+
+    ranking("Events per User", stats['users'], "event(s)")
+    ranking("Events per Type", stats['types'], "event(s)")
+    ranking("Commits per Repository", stats['commits_per_repo'], "commit(s)")
+    ranking("Most Starred Repositories", stats['top_starred'], "star(s)")
+    histogram("Activity per Day", stats['daily'])
+    histogram("Activity per Hour (UTC)", [(f"{hour:02d}:00", count) for hour, count in stats['hourly']])
+
+    for title, ratio in [("Pull Requests", stats['pull_requests']), ("Issues", stats['issues'])]:
+        lines.append(f" [bold green]{title}:[/bold green] [white not bold]{ratio['opened']} opened, {ratio['closed']} closed, ratio {ratio['ratio'] if ratio['ratio'] is not None else 'n/a'}")
+    lines.append("")
+
+    emit(lines)
+
+def repo_lines(repo, details=None):
+    lines = []
+    lines.append(" " + "[bold cyan]=[/bold cyan]" * 80)      
+    lines.append(f" [bold green]Repository name:[/bold green] {repo.name}")
+    lines.append(f" [bold green]Owner:[/bold green] {repo.owner}")
+    lines.append(f" [bold green]Link:[/bold green] {repo.html_url}")
+    lines.append("")
+
+    lines.append(f" [bold magenta]Description:[/bold magenta] {repo.description}")
+    lines.append(f" [bold magenta]Language:[/bold magenta] {repo.language}")
+    lines.append("")
+    
+    lines.append(f" [bold orange3]Watchers:[/bold orange3] [white not bold]{repo.watchers_count}")
+    lines.append(f" [bold red]Forks:[/bold red] [white not bold]{repo.forks_count}")
+    lines.append(f" [bold yellow]Stars:[/bold yellow] [white not bold]{repo.stargazers_count}")
+    lines.append("")
+
+    if details is not None:
+        total = sum(details.languages.values())
+        languages = ", ".join(f"{language} {size / total:.1%}" for language, size in details.languages.items()) if total else "Not provided"
+        release = f"{details.latest_release} on {details.released_at[0:10]}" if details.latest_release else "None"
+        commits = "Not computed by GitHub yet"
+        if details.commits_last_year is not None:
+            commits = f"{details.commits_last_month} in the last 4 weeks, {details.commits_last_year} in the last year"
+
+        lines.append(f" [bold magenta]Languages:[/bold magenta] {languages}")
+        lines.append(f" [bold magenta]Latest release:[/bold magenta] {release}")
+        lines.append(f" [bold orange3]Contributors:[/bold orange3] [white not bold]{details.contributors if details.contributors is not None else "Not provided"}")
+        lines.append(f" [bold orange3]Commits:[/bold orange3] [white not bold]{commits}")
+        lines.append("")
+
+    lines.append(f" [bold blue3]Created on[/bold blue3] [white not bold]{repo.created_at[0:10]}")
+    lines.append(f" [bold blue3]Last updated on[/bold blue3] [white not bold]{repo.updated_at[0:10]}")
+    lines.append(" " + "[bold cyan]=[/bold cyan]" * 80)
+    lines.append("")
+    return lines
+
+def print_repos_header():
+    emit(["", " [bold cyan]Displaying Popular GitHub Repositories[/bold cyan]", ""])
+
+@timed("render")
+def render_repos(repos):
+    lines = [""]
+    lines.append(" [bold cyan]Displaying Popular GitHub Repositories[/bold cyan]")
+    lines.append("")
+
+    for repo in repos:
+        lines.extend(repo_lines(repo))
+
+    emit(lines)
+
+@timed("render")
+def render_repo_card(repo, details):
+    emit(repo_lines(repo, details))
+
+@timed("render")
+def render_rate_limits(budgets):
+    lines = ["", " [bold cyan]Displaying GitHub API Rate Limits[/bold cyan]", ""]
+
+    for resource, stats in budgets:
+        lines.append(f" [bold green]{resource.capitalize()}:[/bold green] [white not bold]{stats['remaining']}/{stats['limit']} requests left, resets at {time.strftime('%H:%M:%S', time.localtime(stats['reset']))}")
+
+    lines.append("")
+    emit(lines)
@@ -0,0 +1,130 @@
+import json
+import os
+import signal
+import sys
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from github_cli.api import fetch_github_activity, fetch_org_members, memo_stats, settings
+from github_cli.client import get_users, search_repositories
+from github_cli.errors import GitHubError
+from github_cli.memo import SingleFlight
+from github_cli.records import record_dict
+from github_cli.remote import state_path
+
+# A long-lived process behind `serve`. It keeps the connection pool, the response cache and the
+# rate limiter warm between CLI runs, and answers lookups as JSON on a local port.
+
+def lookup_users(params):
+    users = get_users(params.get("login", []), params.get("backend", ["rest"])[0])
+    return {"users": [None if user is None else record_dict(user) for user in users]}
+
+def lookup_events(params):
+    max_pages, max_events = (int(params[name][0]) if name in params else None for name in ("max_pages", "max_events"))
+    return {"events": list(fetch_github_activity(params["login"][0], max_pages, max_events))}
+
+def lookup_members(params):
+    return {"members": fetch_org_members(params["org"][0])}
+
+def lookup_repositories(params):
+    repos = search_repositories(
+        params.get("q", [""])[0],
+        int(params.get("limit", [30])[0]),
+        int(params.get("concurrency", [8])[0]),
+        params.get("sort", ["stars"])[0],
+        params.get("order", ["desc"])[0]
+    )
+    return {"repositories": [record_dict(repo) for repo in repos]}
+
+ROUTES = {
+    "/users": lookup_users,
+    "/events": lookup_events,
+    "/members": lookup_members,
+    "/search/repositories": lookup_repositories
+}
+
+class Handler(BaseHTTPRequestHandler):
+    server_version = "github-cli"
+
+    def do_GET(self):
+        url = urllib.parse.urlsplit(self.path)
+        params = urllib.parse.parse_qs(url.query)
+
+        if url.path == "/health":
+            return self.reply(200, {
+                "pid": os.getpid(),
+                "api_url": settings['api_url'],
+                "uptime": round(time.monotonic() - self.server.started, 3),
+                "requests": self.server.requests,
+                "shared": self.server.flights.shared,
+                "memo": memo_stats()
+            })
+
+        route = ROUTES.get(url.path)
+        if route is None:
+            return self.reply(404, {"message": "Not Found"})
+
+        with self.server.lock:
+            self.server.requests += 1
+        key = (url.path, tuple(sorted((name, tuple(values)) for name, values in params.items())))
+
+        # A failed lookup raises the same error in every request waiting on it.
+        try:
+            body = self.server.flights.do(key, lambda: route(params))
+        except (KeyError, ValueError) as e:
+            return self.reply(400, {"message": f"Invalid request: {e}"})
+        except GitHubError as e:
+            return self.reply(502, {"message": e.message})
+
+        self.reply(200, body)
+
+    def reply(self, status, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+def serve(host="127.0.0.1", port=8787, verbose=False):
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    server.verbose = verbose
+    server.started = time.monotonic()
+    server.lock = threading.Lock()
+    server.requests = 0
+    server.flights = SingleFlight()
+    return server
+
+def run_server(host="127.0.0.1", port=8787, verbose=False):
+    server = serve(host, port, verbose)
+    url = f"http://{host}:{server.server_port}"
+
+    # The CLI finds the server through this file and sends its lookups here while it answers.
+    path = state_path()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as file:
+        json.dump({"url": url, "pid": os.getpid(), "api_url": settings['api_url']}, file)
+
+    # Stopping the daemon with SIGTERM still removes the file.
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    print(f"Serving GitHub lookups on {url}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        try:
+            with open(path) as file:
+                if json.load(file).get("pid") == os.getpid():
+                    os.remove(path)
+        except (OSError, ValueError):
+            pass
@@ -0,0 +1,89 @@
+import json
+import mmap
+import os
+import struct
+import threading
+
+from github_cli.jsonstream import loads
+
+# A snapshot is a header followed by one record per lookup: two lengths, the (kind, key) pair and
+# the value, both as JSON. Loading maps the file and only reads the keys, and a value is decoded
+# when it is asked for, so replaying one user from a large snapshot skips everyone else. JSON reads
+# the same on every Python version and decoding it cannot run code, unlike marshal or pickle.
+
+MAGIC = b"GHSNAP"
+VERSION = 2
+HEADER = MAGIC + bytes([VERSION])
+RECORD = struct.Struct("<II")
+
+def as_key(value):
+    # JSON has no tuples, so keys come back as lists and are turned back into hashable tuples.
+    if isinstance(value, list):
+        return tuple(as_key(item) for item in value)
+    return value
+
+class SnapshotWriter:
+    def __init__(self, path):
+        self.lock = threading.Lock()
+        self.file = open(path, "wb")
+        self.file.write(HEADER)
+
+    def add(self, kind, key, value):
+        key_data = json.dumps([kind, key], separators=(",", ":")).encode()
+        value_data = json.dumps(value, separators=(",", ":")).encode()
+
+        with self.lock:
+            self.file.write(RECORD.pack(len(key_data), len(value_data)) + key_data + value_data)
+
+    def close(self):
+        with self.lock:
+            self.file.close()
+
+class Snapshot:
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size < len(HEADER):
+                raise ValueError(f"{path} is not a snapshot")
+            self.buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self.buffer[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a snapshot")
+        if self.buffer[len(MAGIC)] != VERSION:
+            raise ValueError(f"{path} was written by another version of github-cli, save it again")
+
+        self.view = memoryview(self.buffer)
+        self.index = {}
+
+        position = len(HEADER)
+        while position + RECORD.size <= len(self.buffer):
+            key_length, value_length = RECORD.unpack_from(self.buffer, position)
+            start = position + RECORD.size
+            end = start + key_length + value_length
+            # A record cut short by an interrupted save is left out.
+            if end > len(self.buffer):
+                break
+
+            # Every key is a (kind, key) pair, anything else is not ours.
+            pair = as_key(self.decode(start, start + key_length))
+            if not isinstance(pair, tuple) or len(pair) != 2:
+                raise ValueError(f"{path} is not a snapshot")
+            try:
+                self.index[pair] = (start + key_length, end)
+            except TypeError:
+                raise ValueError(f"{path} is not a snapshot") from None
+            position = end
+
+    def __contains__(self, kind_and_key):
+        return kind_and_key in self.index
+
+    def get(self, kind, key):
+        return self.decode(*self.index[(kind, key)])
+
+    def decode(self, start, end):
+        # Both json and orjson report a damaged record as a ValueError, and bytes that are not
+        # UTF-8 as a UnicodeDecodeError, which is one.
+        try:
+            return loads(bytes(self.view[start:end]))
+        except ValueError:
+            raise ValueError(f"{self.path} is not a snapshot") from None
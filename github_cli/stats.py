@@ -0,0 +1,131 @@
+import datetime
+import itertools
+from array import array
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from github_cli.events import EVENT_PARSERS
+
+EVENT_TYPES = list(EVENT_PARSERS)
+
+ACTIONS = ["other", "opened", "closed", "reopened"]
+
+# The column operations, on NumPy arrays when NumPy is installed and on plain sequences otherwise.
+
+def as_column(values):
+    if numpy is not None:
+        return numpy.frombuffer(values, dtype=numpy.int64) if len(values) else numpy.zeros(0, dtype=numpy.int64)
+    return values
+
+def equals(column, value):
+    if numpy is not None:
+        return column == value
+    return [item == value for item in column]
+
+def select(column, mask):
+    if numpy is not None:
+        return column[mask]
+    return array("q", itertools.compress(column, mask))
+
+def bincount(column, weights=None, minlength=0):
+    if numpy is not None:
+        return numpy.bincount(column, weights=weights, minlength=minlength).astype(numpy.int64).tolist()
+
+    counts = [0] * max(minlength, max(column, default=-1) + 1)
+    if weights is None:
+        for code in column:
+            counts[code] += 1
+    else:
+        for code, weight in zip(column, weights):
+            counts[code] += weight
+    return counts
+
+def build_columns(events):
+    # A single pass over the events, which are scattered in memory, turns them into integer columns.
+    # Strings are interned into code tables, numbered in order of first appearance.
+    type_codes = {event_type: code for code, event_type in enumerate(EVENT_TYPES)}
+    action_codes = {action: code for code, action in enumerate(ACTIONS)}
+    users, repos, days = {}, {}, {}
+    columns = {name: array("q") for name in ["user", "type", "repo", "day", "hour", "commits", "action"]}
+    add_user, add_type, add_repo, add_day, add_hour, add_commits, add_action = (columns[name].append for name in columns)
+
+    for event in events:
+        type_code = type_codes.get(event['type'])
+        if type_code is None:
+            continue
+
+        login = event['actor']['login']
+        user = users.get(login)
+        if user is None:
+            user = users[login] = len(users)
+
+        name = event['repo']['name']
+        repo = repos.get(name)
+        if repo is None:
+            repo = repos[name] = len(repos)
+
+        created_at = event['created_at']
+        day = days.get(created_at[0:10])
+        if day is None:
+            day = days[created_at[0:10]] = datetime.date.fromisoformat(created_at[0:10]).toordinal()
+
+        payload = event['payload']
+        commits = payload.get('commits')
+
+        add_user(user)
+        add_type(type_code)
+        add_repo(repo)
+        add_day(day)
+        add_hour(int(created_at[11:13]))
+        add_commits(len(commits) if commits else 0)
+        add_action(action_codes.get(payload.get('action'), 0))
+
+    return {name: as_column(values) for name, values in columns.items()}, list(users), list(repos)
+
+def top(counts, names, limit):
+    ranked = sorted(range(len(counts)), key=counts.__getitem__, reverse=True)
+    return [(names[code], counts[code]) for code in ranked[:limit] if counts[code] > 0]
+
+def action_ratio(columns, event_type):
+    actions = bincount(select(columns['action'], equals(columns['type'], EVENT_TYPES.index(event_type))), minlength=len(ACTIONS))
+    opened, closed = actions[ACTIONS.index("opened")] + actions[ACTIONS.index("reopened")], actions[ACTIONS.index("closed")]
+    return {"opened": opened, "closed": closed, "ratio": round(opened / closed, 2) if closed else None}
+
+def compute_stats(events, limit=10):
+    columns, users, repos = build_columns(events)
+    count = len(columns['type'])
+
+    push_mask = equals(columns['type'], EVENT_TYPES.index("PushEvent"))
+    commits = bincount(select(columns['repo'], push_mask), select(columns['commits'], push_mask), minlength=len(repos))
+    starred = bincount(select(columns['repo'], equals(columns['type'], EVENT_TYPES.index("WatchEvent"))), minlength=len(repos))
+
+    if numpy is not None:
+        first_day = int(columns['day'].min()) if count else 0
+        daily = bincount(columns['day'] - first_day)
+    else:
+        first_day = min(columns['day'], default=0)
+        daily = bincount([day - first_day for day in columns['day']])
+
+    return {
+        "events": count,
+        "users": top(bincount(columns['user'], minlength=len(users)), users, len(users)),
+        "types": top(bincount(columns['type'], minlength=len(EVENT_TYPES)), EVENT_TYPES, len(EVENT_TYPES)),
+        "commits_per_repo": top(commits, repos, limit),
+        "top_starred": top(starred, repos, limit),
+        "daily": [(datetime.date.fromordinal(first_day + offset).isoformat(), total) for offset, total in enumerate(daily)],
+        "hourly": list(enumerate(bincount(columns['hour'], minlength=24))),
+        "pull_requests": action_ratio(columns, "PullRequestEvent"),
+        "issues": action_ratio(columns, "IssuesEvent")
+    }
+
+def stats_rows(stats):
+    yield {"metric": "events", "key": "total", "value": stats['events']}
+    for metric in ["users", "types", "commits_per_repo", "top_starred", "daily", "hourly"]:
+        for key, value in stats[metric]:
+            yield {"metric": metric, "key": key, "value": value}
+    for metric in ["pull_requests", "issues"]:
+        for key, value in stats[metric].items():
+            yield {"metric": metric, "key": key, "value": value}
@@ -0,0 +1,56 @@
+import os
+import threading
+
+import pytest
+from rich.console import Console
+
+from github_cli import api, mockserver, render
+
+# The suite talks to the mock server over a real socket, so the timings include the requests,
+# urllib3 and decoding work a lookup does against GitHub, without the network in between.
+
+@pytest.fixture(scope="session")
+def mock_url():
+    server = mockserver.serve("127.0.0.1", 0, False)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def connect(monkeypatch):
+    # Points the library at a server with a fresh session and rate limiter, and with the disk cache
+    # and the memo switched off so every call reaches the server.
+    def connect(url):
+        monkeypatch.setattr(api, "settings", {**api.settings, "api_url": url, "cache": False, "memo_size": 0, "max_rate": 1000})
+        monkeypatch.setattr(api, "session", None)
+        monkeypatch.setattr(api, "cache", None)
+        monkeypatch.setattr(api, "cache_loaded", False)
+        monkeypatch.setattr(api, "memo", None)
+        monkeypatch.setattr(api, "memo_loaded", False)
+        monkeypatch.setattr(api, "rate_limiters", {})
+        return api
+
+    return connect
+
+@pytest.fixture
+def github(mock_url, connect):
+    return connect(mock_url)
+
+@pytest.fixture
+def mock(monkeypatch):
+    # Changes to the server's fixtures are undone after the test.
+    def update(**options):
+        for name, value in options.items():
+            monkeypatch.setitem(mockserver.fixtures, name, value)
+
+    return update
+
+@pytest.fixture
+def console(monkeypatch):
+    # Rendered output goes to /dev/null through a terminal console, so the styling work is still done.
+    with open(os.devnull, "w") as devnull:
+        console = Console(file=devnull, force_terminal=True, width=120)
+        monkeypatch.setattr(render, "console", console)
+        yield console
@@ -0,0 +1,61 @@
+import pytest
+
+from github_cli import mockserver
+from github_cli.archive import EventArchive
+from github_cli.commands import sync_user_events
+
+@pytest.fixture
+def archive(tmp_path):
+    return EventArchive(str(tmp_path / "events.sqlite"))
+
+def test_sync_stores_only_new_events(github, mock, archive):
+    mock(events_per_user=300)
+    assert sync_user_events(archive, "alice") == (300, 300)
+    assert sync_user_events(archive, "alice") == (0, 300)
+
+    mock(events_per_user=350)
+    assert sync_user_events(archive, "alice") == (50, 350)
+    assert {event['id'] for event in archive.iter_events("alice")} == {event['id'] for event in mockserver.user_events("alice")}
+
+def test_adding_stored_events_again(archive):
+    events = mockserver.user_events("alice")[:10]
+    assert archive.add("alice", events) == 10
+    assert archive.add("alice", events[5:] + mockserver.user_events("alice")[10:12]) == 2
+    assert archive.count("alice") == 12
+
+def test_sync_warns_about_a_gap(github, mock, archive, capsys):
+    # The stored event is older than anything GitHub still lists.
+    mock(events_per_user=300)
+    archive.add("alice", [{**mockserver.user_events("alice")[-1], "id": "1"}])
+
+    sync_user_events(archive, "alice")
+    assert "Some events for alice may be missing" in capsys.readouterr().err
+
+def test_sync_stopped_by_max_pages_does_not_warn(github, mock, archive, capsys):
+    mock(events_per_user=300)
+    archive.add("alice", [{**mockserver.user_events("alice")[-1], "id": "1"}])
+
+    assert sync_user_events(archive, "alice", max_pages=1) == (100, 101)
+    assert capsys.readouterr().err == ""
+
+def test_archive_filters(archive):
+    events = mockserver.user_events("alice")
+    archive.add("alice", events)
+    archive.add("bob", mockserver.user_events("bob"))
+
+    def ids(**filters):
+        return [event['id'] for event in archive.iter_events("alice", **filters)]
+
+    assert ids() == [event['id'] for event in events]
+    assert ids(event_types=["PushEvent", "WatchEvent"]) == [event['id'] for event in events if event['type'] in ("PushEvent", "WatchEvent")]
+    assert ids(repos=["alice/repo3"]) == [event['id'] for event in events if event['repo']['name'] == "alice/repo3"]
+
+    since, until = events[200]['created_at'], events[100]['created_at']
+    assert ids(since=since, until=until) == [event['id'] for event in events[101:201]]
+    assert ids(limit=5) == [event['id'] for event in events[:5]]
+    assert ids(event_types=["PushEvent"], limit=3) == [event['id'] for event in events if event['type'] == "PushEvent"][:3]
+
+def test_archive_is_per_user(archive):
+    archive.add("alice", mockserver.user_events("alice")[:3])
+    assert list(archive.iter_events("Bob")) == []
+    assert archive.count("ALICE") == 3
@@ -0,0 +1,86 @@
+import json
+import os
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from github_cli import client, mockserver
+from github_cli.cache import ResponseCache
+from github_cli.profiling import add_hook, remove_hook
+
+@pytest.fixture
+def cached(github, tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    github.configure(cache=True, cache_ttl=60)
+    return github
+
+@pytest.fixture
+def requests_sent():
+    # The status of every response GitHub (here the mock server) sent back.
+    statuses = []
+
+    def hook(name, start, duration, self_duration, info):
+        if name == "fetch":
+            statuses.append(info['status'])
+
+    add_hook(hook)
+    yield statuses
+    remove_hook(hook)
+
+def test_fresh_response_is_served_from_disk(cached, requests_sent):
+    assert client.get_user("octocat").login == "octocat"
+    assert client.get_user("octocat").login == "octocat"
+    assert requests_sent == [200]
+
+def test_stale_response_is_revalidated(cached, requests_sent):
+    cached.configure(cache_ttl=0)
+    first = client.get_user("octocat")
+    second = client.get_user("octocat")
+
+    # The mock only answers 304 when If-None-Match carries the ETag it sent.
+    assert requests_sent == [200, 304]
+    assert second == first
+
+def test_changed_response_replaces_the_cached_one(cached, requests_sent, mock, tmp_path):
+    cached.configure(cache_ttl=0)
+    (tmp_path / "recorded" / "users").mkdir(parents=True)
+    path = tmp_path / "recorded" / "users" / "octocat.json"
+    mock(fixtures_dir=str(tmp_path / "recorded"))
+
+    path.write_text(json.dumps({**mockserver.user_profile("octocat"), "name": "Before"}))
+    assert client.get_user("octocat").name == "Before"
+    path.write_text(json.dumps({**mockserver.user_profile("octocat"), "name": "After"}))
+    assert client.get_user("octocat").name == "After"
+    assert requests_sent == [200, 200]
+
+def response(content, **headers):
+    return SimpleNamespace(content=content, headers=headers)
+
+def test_least_recently_used_responses_are_evicted(tmp_path):
+    # Random bytes do not compress, so each entry takes about 1000 bytes.
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"), 60, 2500)
+    cache.store("a", response(os.urandom(1000)))
+    time.sleep(0.01)
+    cache.store("b", response(os.urandom(1000)))
+    time.sleep(0.01)
+    cache.get("a")
+    time.sleep(0.01)
+    cache.store("c", response(os.urandom(1000)))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+def test_time_to_live(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"), 10, 1024 * 1024)
+    start = time.time()
+    cache.store("user", response(b"{}", ETag='"abc"'))
+    cache.store("events", response(b"[]", **{"X-Poll-Interval": "60", "Link": '<https://example.com?page=2>; rel="next"'}))
+
+    user, events = cache.get("user"), cache.get("events")
+    assert user['etag'] == '"abc"'
+    assert start + 10 <= user['expires'] < start + 11
+    # GitHub's poll interval outlasts a shorter time to live.
+    assert start + 60 <= events['expires'] < start + 61
+    assert events['headers'] == {"Link": '<https://example.com?page=2>; rel="next"', "X-Poll-Interval": "60"}
+    assert events['body'] == b"[]"
@@ -0,0 +1,68 @@
+import pytest
+
+from github_cli import mockserver
+from github_cli.events import EVENT_KEYS, EVENT_PARSERS, GROUPED_EVENTS, build_repo_event_info, classify_events
+from github_cli.jsonstream import project
+
+@pytest.fixture
+def events(mock):
+    # The events as fetch_events_page keeps them, covering every event type.
+    mock(events_per_user=300)
+    return [project(event, EVENT_KEYS) for event in mockserver.user_events("octocat")]
+
+def test_classify_events(benchmark, events):
+    collected = benchmark(classify_events, events, list(EVENT_PARSERS))
+    assert set(collected) == set(EVENT_PARSERS)
+
+def test_build_repo_event_info(benchmark, events):
+    repo_event_info = benchmark(lambda: build_repo_event_info(classify_events(events, list(EVENT_PARSERS))))
+    assert all(entry['info'] for entry in repo_event_info)
+
+# Grouping by repository used to search the repositories collected so far for every event, which
+# grew quadratically with the history. The linear scan is kept as a reference and only timed up to
+# 10k events, where it is already an order of magnitude slower.
+
+GROUPED_TYPES = ["PushEvent", "PullRequestEvent", "IssuesEvent"]
+
+def classify_linear(data, event_types):
+    collected = {event_type: [] for event_type in event_types}
+
+    for event in data:
+        if event['type'] not in collected:
+            continue
+
+        info_key = GROUPED_EVENTS[event['type']]
+        repos = collected[event['type']]
+        for record in EVENT_PARSERS[event['type']](event):
+            repo = next((repo for repo in repos if repo['repo_name'] == record.repo_name), None)
+            if repo is None:
+                repos.append({"repo_name": record.repo_name, info_key: [record]})
+            else:
+                repo[info_key].append(record)
+
+    return collected
+
+def grouped_events(count):
+    # Pushes, pull requests and issues in turn, with a new repository every ten events.
+    templates = [project(mockserver.event("octocat", serial, "2024-01-01T00:00:00Z"), EVENT_KEYS) for serial in range(len(GROUPED_TYPES))]
+    return [{**templates[index % len(templates)], "repo": {"name": f"octocat/repo{index // 10}"}} for index in range(count)]
+
+@pytest.mark.parametrize("count", [100, 1000, 10000, 100000])
+def test_group_events(benchmark, count):
+    events = grouped_events(count)
+    collected = benchmark(classify_events, events, GROUPED_TYPES)
+    assert len(collected['PullRequestEvent']) == len({event['repo']['name'] for event in events if event['type'] == "PullRequestEvent"})
+
+@pytest.mark.parametrize("count", [100, 1000, 10000])
+def test_group_events_linear(benchmark, count):
+    events = grouped_events(count)
+    collected = benchmark(classify_linear, events, GROUPED_TYPES)
+    assert collected == classify_events(events, GROUPED_TYPES)
+
+def test_release_event():
+    # GitHub nests the release under payload.release.
+    event = project(mockserver.event("octocat", 6, "2024-05-01T10:00:00Z"), EVENT_KEYS)
+    assert event['type'] == "ReleaseEvent"
+
+    [release] = EVENT_PARSERS["ReleaseEvent"](event)
+    assert (release.release_name, release.tag_name, release.timestamp) == ("Release 6", "v6", "2024-05-01")
@@ -0,0 +1,47 @@
+import json
+
+import pytest
+
+from github_cli import api, client, mockserver
+from github_cli.errors import GitHubError
+
+def test_fetch_user(benchmark, github):
+    user = benchmark(client.get_user, "octocat")
+    assert user.login == "octocat"
+
+def test_fetch_events(benchmark, github, mock):
+    mock(events_per_user=300)
+    events = benchmark(lambda: list(api.fetch_github_activity("octocat")))
+    assert len(events) == 300
+
+def test_fetch_events_streamed(benchmark, github, mock):
+    mock(events_per_user=300)
+    github.configure(stream_json=True)
+    events = benchmark(lambda: list(api.fetch_github_activity("octocat")))
+    assert len(events) == 300
+
+def test_search_repositories(benchmark, github):
+    repos = benchmark(client.search_repositories, "stars:>1000", 100)
+    assert len(repos) == 100
+    assert repos == sorted(repos, key=lambda repo: repo.stargazers_count, reverse=True)
+
+def test_enrich_repositories(benchmark, github):
+    repos = client.search_repositories("stars:>1000", 30)
+    enriched = benchmark(lambda: list(client.enrich_repositories(repos)))
+    assert len(enriched) == 30
+
+def test_recorded_response(github, mock, tmp_path):
+    # A response saved under the fixtures directory replaces the synthetic one for that path only.
+    (tmp_path / "users").mkdir()
+    (tmp_path / "users" / "recorded.json").write_text(json.dumps({**mockserver.user_profile("recorded"), "name": "Recorded User"}))
+    mock(fixtures_dir=str(tmp_path))
+
+    user = client.get_user("recorded")
+    assert user.name == "Recorded User"
+    assert client.get_user("octocat").login == "octocat"
+
+def test_events_of_a_missing_user(github, mock):
+    mock(missing_users={"ghost"})
+    with pytest.raises(GitHubError, match="User ghost not found") as error:
+        list(client.iter_events("ghost"))
+    assert error.value.status == 404
@@ -0,0 +1,47 @@
+import pytest
+
+from github_cli import client
+from github_cli.errors import GitHubError
+from github_cli.profiling import add_hook, remove_hook
+
+@pytest.fixture
+def graphql(github, mock, monkeypatch):
+    monkeypatch.setenv("GITHUB_TOKEN", "test-token")
+    mock(missing_users={"ghost"})
+    return github
+
+@pytest.fixture
+def fetched():
+    urls = []
+
+    def hook(name, start, duration, self_duration, info):
+        if name == "fetch":
+            urls.append(info['url'])
+
+    add_hook(hook)
+    yield urls
+    remove_hook(hook)
+
+def test_users_come_back_in_the_order_asked(graphql, fetched):
+    logins = ["bob", "ghost", "alice", "Carol"]
+    users = client.get_users(logins, backend="graphql")
+
+    assert [user and user.login for user in users] == ["bob", None, "alice", "Carol"]
+    assert len(fetched) == 1 and fetched[0].endswith("/graphql")
+
+def test_graphql_matches_rest(graphql):
+    logins = ["alice", "ghost", "bob"]
+    assert client.get_users(logins, backend="graphql") == client.get_users(logins, backend="rest")
+
+def test_only_missing_users(graphql):
+    assert client.get_users(["ghost"], backend="graphql") == [None]
+
+def test_graphql_needs_a_token(github, monkeypatch):
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    with pytest.raises(GitHubError) as error:
+        client.get_users(["alice"], backend="graphql")
+    assert error.value.status == 401
+
+def test_unknown_backend(github):
+    with pytest.raises(ValueError):
+        client.get_users(["alice"], backend="soap")
@@ -0,0 +1,108 @@
+import threading
+import time
+
+import pytest
+
+from github_cli import api, client
+from github_cli.memo import Memo, SingleFlight
+from github_cli.profiling import add_hook, remove_hook
+
+@pytest.fixture
+def memoized(github):
+    github.configure(memo_size=16)
+    return github
+
+@pytest.fixture
+def fetched():
+    urls = []
+
+    def hook(name, start, duration, self_duration, info):
+        if name == "fetch":
+            urls.append(info['url'])
+
+    add_hook(hook)
+    yield urls
+    remove_hook(hook)
+
+def test_repeated_lookups_are_answered_from_memory(memoized, fetched):
+    assert client.get_user("octocat").login == "octocat"
+    assert client.get_user("octocat").login == "octocat"
+    # Logins are case-insensitive, so another spelling is the same lookup.
+    assert client.get_user("OctoCat").login == "octocat"
+
+    assert len(fetched) == 1
+    assert api.memo_stats() == {"hits": 2, "misses": 1, "shared": 0, "entries": 1}
+
+def test_event_pages_are_memoized(memoized, fetched, mock):
+    mock(events_per_user=300)
+    first = list(api.fetch_github_activity("octocat"))
+    second = list(api.fetch_github_activity("octocat"))
+
+    assert second == first and len(first) == 300
+    assert len(fetched) == 3
+
+def test_concurrent_lookups_share_one_request(memoized, fetched, mock):
+    mock(latency=0.2)
+    barrier = threading.Barrier(5)
+    users = [None] * 5
+
+    def lookup(index):
+        barrier.wait()
+        users[index] = client.get_user("octocat")
+
+    threads = [threading.Thread(target=lookup, args=(index,)) for index in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(user == users[0] for user in users)
+    assert len(fetched) == 1
+    assert api.memo_stats()['shared'] == 4
+
+def test_least_recently_used_entries_are_dropped():
+    memo = Memo(2, 60)
+    calls = []
+    load = lambda key: memo.get(key, lambda: calls.append(key) or key.upper())
+
+    assert [load("a"), load("b"), load("a"), load("c"), load("a"), load("b")] == ["A", "B", "A", "C", "A", "B"]
+    assert calls == ["a", "b", "c", "b"]
+
+def test_expired_entries_are_loaded_again():
+    memo = Memo(2, 0)
+    calls = []
+    memo.get("a", lambda: calls.append("a"))
+    memo.get("a", lambda: calls.append("a"))
+    assert calls == ["a", "a"]
+
+def test_a_failure_reaches_every_waiter():
+    flights = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    errors = []
+
+    def fail():
+        started.set()
+        release.wait()
+        raise ValueError("upstream failed")
+
+    def call(function):
+        try:
+            flights.do("key", function)
+        except ValueError as e:
+            errors.append(str(e))
+
+    leader = threading.Thread(target=call, args=(fail,))
+    leader.start()
+    started.wait()
+    followers = [threading.Thread(target=call, args=(lambda: "never called",)) for _ in range(3)]
+    for follower in followers:
+        follower.start()
+    while flights.shared < 3:
+        time.sleep(0.01)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join()
+
+    assert errors == ["upstream failed"] * 4
+    # The failed call is forgotten, so the next one tries again.
+    assert flights.do("key", lambda: "retried") == "retried"
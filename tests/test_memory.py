@@ -0,0 +1,52 @@
+import re
+import subprocess
+import sys
+import tracemalloc
+
+import pytest
+
+from github_cli import api, client
+
+# Peak allocations of a lookup, from the request to the records. The mock server runs in its own
+# process here, so only the client's memory is traced. The budgets are loose: they catch a path
+# that starts keeping whole responses or every page around.
+
+@pytest.fixture(scope="module")
+def mock_process_url():
+    server = subprocess.Popen([sys.executable, "-m", "github_cli.mockserver", "--port", "0"], stderr=subprocess.PIPE, text=True)
+    try:
+        yield re.search(r"http://\S+", server.stderr.readline()).group()
+    finally:
+        server.terminate()
+        server.wait()
+
+@pytest.fixture
+def github(mock_process_url, connect):
+    github = connect(mock_process_url)
+    # Imports and the first connection are paid before tracing starts.
+    client.get_user("octocat")
+    return github
+
+def peak_memory(function):
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def test_events_memory(github):
+    peak = peak_memory(lambda: list(api.fetch_github_activity("octocat")))
+    assert peak < 2_000_000
+
+def test_search_memory(github):
+    peak = peak_memory(lambda: client.search_repositories("stars:>1000", 100))
+    assert peak < 4_000_000
+
+def test_popular_memory(github):
+    def popular():
+        repos = client.search_repositories("stars:>1000", 30)
+        list(client.enrich_repositories(repos))
+
+    peak = peak_memory(popular)
+    assert peak < 2_000_000
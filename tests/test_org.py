@@ -0,0 +1,42 @@
+import json
+import os
+import subprocess
+import sys
+
+from github_cli import mockserver
+from github_cli.commands import merge_member_events
+from github_cli.events import DEFAULT_EVENTS, EVENT_KEYS, EVENT_PARSERS
+from github_cli.jsonstream import project
+from github_cli.records import record_dict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def newest_first(events):
+    return sorted(events, key=lambda event: (event['created_at'], int(event['id'])), reverse=True)
+
+def test_merge_is_newest_first():
+    # The mock gives every member an event each hour, so ties on created_at are broken by id.
+    streams = [mockserver.user_events(login)[offset:] for offset, login in enumerate(["alice", "bob", "carol"])]
+    merged = list(merge_member_events(streams))
+
+    assert len(merged) == sum(len(stream) for stream in streams)
+    assert merged == newest_first([event for stream in streams for event in stream])
+
+def test_merge_of_uneven_members():
+    streams = [mockserver.user_events("alice")[:5], [], mockserver.user_events("bob")[250:]]
+    assert list(merge_member_events(streams)) == newest_first(streams[0] + streams[2])
+
+def test_org_command_output_order(mock_url, mock, tmp_path):
+    mock(members_per_org=3, events_per_user=120)
+    members = [f"acme-member{serial}" for serial in range(3)]
+    environment = {**os.environ, "GITHUB_API_URL": mock_url, "XDG_CACHE_HOME": str(tmp_path / "cache"), "XDG_DATA_HOME": str(tmp_path / "data")}
+    result = subprocess.run([sys.executable, "-m", "github_cli", "org", "acme", "--format", "ndjson"], capture_output=True, text=True, cwd=ROOT, env=environment)
+    assert result.returncode == 0, result.stderr
+
+    events = newest_first([project(event, EVENT_KEYS) for member in members for event in mockserver.user_events(member)])
+    expected = [
+        {"user": event['actor']['login'], "type": event['type'], **record_dict(record)}
+        for event in events if event['type'] in DEFAULT_EVENTS
+        for record in EVENT_PARSERS[event['type']](event)
+    ]
+    assert [json.loads(line) for line in result.stdout.splitlines()] == expected
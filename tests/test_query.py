@@ -0,0 +1,54 @@
+import datetime
+
+import pytest
+
+from github_cli import client, mockserver
+from github_cli.query import build_query, canonical_query, parse_query, parse_range, with_range
+
+def test_parse_range():
+    assert parse_range(">=10", int) == (10, None)
+    assert parse_range(">10", int) == (11, None)
+    assert parse_range("<=10", int) == (None, 10)
+    assert parse_range("<10", int) == (None, 9)
+    assert parse_range("10..20", int) == (10, 20)
+    assert parse_range("*..20", int) == (None, 20)
+    assert parse_range("7", int) == (7, 7)
+    assert parse_range(">2024-01-31", datetime.date.fromisoformat) == (datetime.date(2024, 2, 1), None)
+
+    with pytest.raises(ValueError):
+        parse_range("ten", int)
+
+def test_qualifiers_are_sorted():
+    assert canonical_query("topic:CLI language:Go") == canonical_query("language:go topic:cli") == "language:go topic:cli"
+
+def test_free_text_keeps_its_order():
+    assert canonical_query("a OR b") == "a OR b"
+    assert canonical_query("cli NOT web tool") == "cli NOT web tool"
+    assert canonical_query('language:go "command line" OR tui') == '"command line" OR tui language:go'
+
+def test_ranges_are_merged():
+    assert build_query([("stars", ">=10"), ("stars", "<=50"), ("stars", ">20")]) == "stars:21..50"
+    assert canonical_query("stars:>=10 stars:<=10") == "stars:10"
+    assert canonical_query("created:>=2024-01-01 created:<2024-07-01") == "created:2024-01-01..2024-06-30"
+
+def test_empty_range_is_rejected():
+    with pytest.raises(ValueError, match="stars:>=10 and stars:<=5"):
+        canonical_query("stars:>=10 stars:<=5")
+    with pytest.raises(ValueError):
+        canonical_query("stars:>5 stars:<6")
+
+def test_invalid_range_is_rejected():
+    with pytest.raises(ValueError, match="Invalid stars range"):
+        canonical_query("stars:>=many")
+
+def test_with_range_narrows_the_window():
+    assert with_range("language:go stars:>100", "stars", (None, 500)) == "language:go stars:101..500"
+    assert with_range("language:go", "stars", (None, 500)) == "language:go stars:<=500"
+    assert parse_query(with_range("a OR b", "stars", (None, 5))) == [("", "a"), ("", "OR"), ("", "b"), ("stars", "<=5")]
+
+def test_search_is_split_by_stars(github):
+    # The Search API stops at 1000 results, so the rest come from a second, narrower search.
+    repos = client.search_repositories("stars:>0", 1500)
+
+    expected = sorted(mockserver.repositories(mockserver.fixtures['repo_count']), key=lambda repo: repo['stargazers_count'], reverse=True)
+    assert [repo.html_url for repo in repos] == [repo['html_url'] for repo in expected[:1500]]
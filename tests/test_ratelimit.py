@@ -0,0 +1,46 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from github_cli import client
+from github_cli.errors import GitHubError
+from github_cli.ratelimit import RateLimiter
+
+def test_retry_after(github, mock):
+    mock(rate_limited=1, rate_limit="retry-after", retry_after=1)
+
+    start = time.perf_counter()
+    assert client.get_user("octocat").login == "octocat"
+    assert time.perf_counter() - start >= 1
+
+def test_exhausted_budget_waits_for_reset(github, mock):
+    mock(rate_limited=1, rate_limit="primary", retry_after=1)
+
+    start = time.perf_counter()
+    assert client.get_user("octocat").login == "octocat"
+    assert time.perf_counter() - start >= 1
+
+def test_wait_past_max_wait_gives_up(github, mock):
+    # A secondary limit without a hint means waiting a minute, more than --max-wait allows.
+    mock(rate_limited=1, rate_limit="secondary")
+    github.configure(max_wait=5)
+
+    start = time.perf_counter()
+    with pytest.raises(GitHubError):
+        client.get_user("octocat")
+    assert time.perf_counter() - start < 5
+
+def test_retries_run_out(github, mock):
+    mock(rate_limited=5, rate_limit="retry-after", retry_after=1)
+    github.configure(retries=1)
+
+    with pytest.raises(GitHubError) as error:
+        client.get_user("octocat")
+    assert error.value.status == 429
+
+def test_jitter_stays_within_max_wait():
+    limiter = RateLimiter(15, 60)
+    response = SimpleNamespace(headers={"Retry-After": "55"})
+    for _ in range(1000):
+        assert 55 <= limiter.backoff(response, 0) <= 60
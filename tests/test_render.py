@@ -0,0 +1,46 @@
+import pytest
+
+from github_cli import client, mockserver, render
+from github_cli.events import EVENT_KEYS, EVENT_PARSERS, build_repo_event_info, classify_events
+from github_cli.jsonstream import project
+from github_cli.records import Repo
+
+def test_render_user(benchmark, github, console):
+    user = client.get_user("octocat")
+    benchmark(render.render_user, "octocat", user)
+
+def test_render_events(benchmark, console, mock):
+    mock(events_per_user=300)
+    events = [project(event, EVENT_KEYS) for event in mockserver.user_events("octocat")]
+    repo_event_info = build_repo_event_info(classify_events(events, list(EVENT_PARSERS)))
+    benchmark(render.render_events, repo_event_info)
+
+@pytest.mark.parametrize("count", [30, 100])
+def test_render_repos(benchmark, console, count):
+    repos = [Repo.from_json(repo) for repo in mockserver.repositories(count)]
+    benchmark(render.render_repos, repos)
+
+# Rendering used to print every line on its own, which renders and writes them one at a time.
+# emit() renders the whole batch and writes it in one pass, the per-line loop is the reference.
+
+@pytest.fixture
+def event_lines(mock, monkeypatch):
+    mock(events_per_user=300)
+    events = [project(event, EVENT_KEYS) for event in mockserver.user_events("octocat")]
+    repo_event_info = build_repo_event_info(classify_events(events, list(EVENT_PARSERS)))
+
+    lines = []
+    with monkeypatch.context() as patch:
+        patch.setattr(render, "emit", lines.extend)
+        render.render_events(repo_event_info)
+    return lines
+
+def test_print_lines_batched(benchmark, console, event_lines):
+    benchmark(render.emit, event_lines)
+
+def test_print_lines_one_by_one(benchmark, console, event_lines):
+    def print_lines():
+        for line in event_lines:
+            console.print(line)
+
+    benchmark(print_lines)
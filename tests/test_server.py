@@ -0,0 +1,64 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from github_cli import mockserver, remote, server
+from github_cli.commands import lookup_members
+from github_cli.profiling import Profiler, add_hook, remove_hook
+
+@pytest.fixture
+def daemon(github):
+    instance = server.serve("127.0.0.1", 0)
+    thread = threading.Thread(target=instance.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{instance.server_port}"
+    instance.shutdown()
+    instance.server_close()
+
+@pytest.fixture
+def stages():
+    # Every stage that finishes in this process, the server's included, as (name, url) pairs.
+    seen = []
+    hook = lambda name, start, duration, self_duration, info: seen.append((name, info.get('url')))
+    add_hook(hook)
+    yield seen
+    remove_hook(hook)
+
+def test_identical_lookups_share_one_fetch(daemon, mock, stages):
+    # Each page takes long enough that all five lookups arrive while the first is still running.
+    mock(events_per_user=300, latency=0.2)
+    barrier = threading.Barrier(5)
+    results = [None] * 5
+
+    def lookup(index):
+        barrier.wait()
+        results[index] = list(remote.fetch_github_activity(daemon, "alice"))
+
+    threads = [threading.Thread(target=lookup, args=(index,)) for index in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(result == results[0] for result in results) and len(results[0]) == 300
+    assert len([url for name, url in stages if name == "fetch" and "/users/alice/events" in url]) == 3
+    assert remote.server_get(daemon, "/health", {})['shared'] == 4
+
+def test_org_members_go_through_the_server(daemon, mock, stages):
+    mock(members_per_org=30, missing_users={"ghostorg"})
+    args = SimpleNamespace(snapshot=None, recorder=None, server=daemon)
+
+    members = lookup_members(args, "acme")
+    assert len(members) == 30
+    assert any(name == "server" and "/members?org=acme" in url for name, url in stages)
+    assert lookup_members(args, "ghostorg") is None
+
+def test_profile_lists_server_lookups_apart():
+    profiler = Profiler()
+    profiler("server", profiler.started, 0.002, 0.002, {"url": "http://127.0.0.1:8787/users?login=alice", "status": 200, "bytes": 300})
+
+    summary = "\n".join(profiler.summary())
+    assert "Connections" not in summary
+    assert "Server 1 lookups answered by the github-cli server" in summary
+    assert "http://127.0.0.1:8787/users?login=alice" in summary
@@ -0,0 +1,96 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from github_cli.snapshot import HEADER, RECORD, Snapshot, SnapshotWriter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LOOKUPS = [
+    ("user", "alice", {"login": "alice", "name": None, "followers": 3}),
+    ("user", "ghost", None),
+    ("events", ("alice", None, 50), [{"type": "PushEvent", "repo": {"name": "alice/repo1"}}]),
+    ("search", ("language:go", "stars", "desc", 5), [{"name": "project-1", "stargazers_count": 250000}])
+]
+
+def write_snapshot(path, lookups=LOOKUPS):
+    writer = SnapshotWriter(path)
+    for kind, key, value in lookups:
+        writer.add(kind, key, value)
+    writer.close()
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "run.snap"
+    write_snapshot(path)
+
+    snapshot = Snapshot(path)
+    for kind, key, value in LOOKUPS:
+        assert (kind, key) in snapshot
+        assert snapshot.get(kind, key) == value
+    assert ("events", ("alice", None, None)) not in snapshot
+
+def test_truncated_snapshot_keeps_complete_records(tmp_path):
+    path = tmp_path / "run.snap"
+    write_snapshot(path)
+    path.write_bytes(path.read_bytes()[:-10])
+
+    snapshot = Snapshot(path)
+    assert [key for key in snapshot.index] == [(kind, key) for kind, key, _ in LOOKUPS[:-1]]
+
+def test_damaged_key(tmp_path):
+    path = tmp_path / "run.snap"
+    write_snapshot(path)
+    data = bytearray(path.read_bytes())
+    data[len(HEADER) + RECORD.size] = ord("{")
+    path.write_bytes(bytes(data))
+
+    with pytest.raises(ValueError, match="is not a snapshot"):
+        Snapshot(path)
+
+def test_damaged_value(tmp_path):
+    path = tmp_path / "run.snap"
+    write_snapshot(path, LOOKUPS[:1])
+    path.write_bytes(path.read_bytes()[:-1] + b"\xff")
+
+    snapshot = Snapshot(path)
+    with pytest.raises(ValueError, match="is not a snapshot"):
+        snapshot.get("user", "alice")
+
+def test_key_that_is_not_a_pair(tmp_path):
+    path = tmp_path / "run.snap"
+    key, value = json.dumps("ab").encode(), b"null"
+    path.write_bytes(HEADER + RECORD.pack(len(key), len(value)) + key + value)
+
+    with pytest.raises(ValueError, match="is not a snapshot"):
+        Snapshot(path)
+
+def test_not_a_snapshot(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_text("Some notes that are long enough")
+    with pytest.raises(ValueError, match="is not a snapshot"):
+        Snapshot(path)
+
+def test_other_version(tmp_path):
+    path = tmp_path / "old.snap"
+    path.write_bytes(HEADER[:-1] + bytes([1]) + b"\x00" * 16)
+    with pytest.raises(ValueError, match="another version"):
+        Snapshot(path)
+
+def run_cli(mock_url, tmp_path, *args):
+    environment = {**os.environ, "GITHUB_API_URL": mock_url, "XDG_CACHE_HOME": str(tmp_path / "cache"), "XDG_DATA_HOME": str(tmp_path / "data")}
+    return subprocess.run([sys.executable, "-m", "github_cli", *args], capture_output=True, text=True, cwd=ROOT, env=environment)
+
+def test_save_and_load(mock_url, tmp_path):
+    path = str(tmp_path / "run.snap")
+    saved = run_cli(mock_url, tmp_path, "events", "alice", "--max-events", "40", "--format", "ndjson", "--save", path)
+    loaded = run_cli("http://127.0.0.1:9", tmp_path, "events", "alice", "--max-events", "40", "--format", "ndjson", "--load", path)
+    assert saved.returncode == loaded.returncode == 0
+    assert loaded.stdout == saved.stdout
+
+    # The same user without the limit was never saved, so it is not replayed from the shorter history.
+    missing = run_cli("http://127.0.0.1:9", tmp_path, "events", "alice", "--format", "ndjson", "--load", path)
+    assert missing.returncode == 1
+    assert "without --max-pages or --max-events is not in the snapshot" in missing.stderr
@@ -0,0 +1,30 @@
+import os
+import subprocess
+import sys
+
+# `help` is answered before the HTTP stack and the archive are imported, which keeps it instant.
+# The budget is generous, since it only has to catch an eager import creeping back in.
+
+IMPORT_BUDGET = 0.15
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def import_times(*args):
+    result = subprocess.run([sys.executable, "-X", "importtime", "-m", "github_cli", *args], capture_output=True, text=True, cwd=ROOT)
+    assert result.returncode == 0, result.stderr
+
+    # Each line is "import time: self | cumulative | name", nested imports indented under the
+    # module that asked for them. Everything up to site is interpreter startup.
+    lines = [line.split("|") for line in result.stderr.splitlines() if line.startswith("import time:")]
+    modules = [(name[1:], int(cumulative)) for _, cumulative, name in lines[1:]]
+    startup = max(index for index, (name, _) in enumerate(modules) if name.strip() == "site")
+    return {name.strip(): cumulative / 1e6 for name, cumulative in modules[startup + 1:] if not name.startswith(" ")}, [name.strip() for name, _ in modules]
+
+def test_help_skips_heavy_imports():
+    _, modules = import_times("help")
+    for module in ["requests", "urllib3", "sqlite3", "github_cli.api"]:
+        assert module not in modules
+
+def test_help_import_time():
+    times, _ = import_times("help")
+    assert sum(times.values()) < IMPORT_BUDGET, times
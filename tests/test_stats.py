@@ -0,0 +1,37 @@
+import pytest
+
+from github_cli import mockserver, stats
+from github_cli.events import EVENT_KEYS
+from github_cli.jsonstream import project
+
+@pytest.fixture
+def events(mock):
+    mock(events_per_user=300)
+    return [project(event, EVENT_KEYS) for login in ["alice", "bob"] for event in mockserver.user_events(login)]
+
+def compute_without_numpy(monkeypatch, events):
+    with monkeypatch.context() as patch:
+        patch.setattr(stats, "numpy", None)
+        return stats.compute_stats(events)
+
+def test_compute_stats(monkeypatch, events):
+    result = compute_without_numpy(monkeypatch, events)
+
+    assert result['events'] == 600
+    assert result['users'] == [("alice", 300), ("bob", 300)]
+    assert sum(count for _, count in result['types']) == 600
+    assert sum(count for _, count in result['daily']) == 600
+    assert sum(count for _, count in result['hourly']) == 600
+    pushes = [event for event in events if event['type'] == "PushEvent"]
+    assert sum(count for _, count in result['commits_per_repo']) <= sum(len(event['payload']['commits']) for event in pushes)
+
+def test_compute_stats_without_events(monkeypatch):
+    result = compute_without_numpy(monkeypatch, [])
+    assert result['events'] == 0
+    assert result['daily'] == []
+
+@pytest.mark.parametrize("sample", [slice(None), slice(0, 0), slice(0, 1)])
+def test_numpy_matches_plain_columns(monkeypatch, events, sample):
+    pytest.importorskip("numpy")
+    assert stats.numpy is not None
+    assert stats.compute_stats(events[sample]) == compute_without_numpy(monkeypatch, events[sample])